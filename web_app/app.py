@@ -3,9 +3,13 @@ import streamlit as st
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.append(str(src_path))
+from styles import get_css
+
+# Add src to path for imports (guarded: Streamlit reruns this script on
+# every interaction, and unguarded appends grow sys.path without bound)
+src_path = str(Path(__file__).parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Page configuration
 st.set_page_config(
@@ -23,145 +27,136 @@ if 'patient_data' not in st.session_state:
 if 'model_loaded' not in st.session_state:
     st.session_state.model_loaded = False
 
-# Custom CSS for styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: bold;
-    }
-    .nav-button {
-        width: 100%;
-        margin: 0.25rem 0;
-        padding: 0.5rem;
-        border-radius: 5px;
-        border: none;
-        background-color: #f0f2f6;
-        cursor: pointer;
-    }
-    .nav-button:hover {
-        background-color: #e0e2e6;
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-        margin: 0.5rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .sidebar .element-container {
-        margin-bottom: 1rem;
-    }
-    .status-indicator {
-        padding: 0.5rem;
-        border-radius: 5px;
-        margin: 0.5rem 0;
-        text-align: center;
-        font-weight: bold;
-    }
-    .status-success {
-        background-color: #d4edda;
-        color: #155724;
-    }
-    .status-warning {
-        background-color: #fff3cd;
-        color: #856404;
-    }
-    .status-info {
-        background-color: #d1ecf1;
-        color: #0c5460;
-    }
-</style>
-""", unsafe_allow_html=True)
+# App-wide CSS, injected once here (pages no longer carry their own blocks)
+st.markdown(get_css(), unsafe_allow_html=True)
+
+def load_model():
+    """Fetch the process-wide ModelHandler.
+
+    Caching lives in model_handler.get_model_handler (cache_resource), so
+    the deserialized estimator and the feature engineer are shared across
+    sessions and pages; this wrapper just keeps the page-level error UX.
+    """
+    try:
+        from model_handler import get_model_handler
+        return get_model_handler()
+    except Exception as e:
+        st.error(f"Failed to load model: {e}")
+        return None
+
+# Static status-indicator HTML, built once at import time so the rerun path
+# only formats the two parameterized strings (prediction and patient data)
+_STATUS_HTML = {
+    'model_loaded': '<div class="status-indicator status-success">✅ Model Loaded</div>',
+    'model_warn': '<div class="status-indicator status-warning">⚠️ Model Not Loaded</div>',
+    'no_prediction': '<div class="status-indicator status-info">📝 No Prediction Yet</div>',
+    'no_patient': '<div class="status-indicator status-info">👤 No Patient Data</div>',
+}
+
+@st.cache_data
+def _metrics_html():
+    """Prebuilt quick-stats card row; the values are static so the HTML is
+    built once instead of instantiating four st.metric widgets per rerun."""
+    cards = [
+        ("Model Accuracy", "85.4%", "Area Under ROC Curve"),
+        ("Risk Factors", "12+", "Medical and lifestyle factors analyzed"),
+        ("Predictions Made", "1,247", "Total assessments completed"),
+        ("Processing Time", "&lt;2s", "Average prediction time"),
+    ]
+    card_html = "".join(
+        f'<div class="metric-card" style="flex:1;text-align:center" title="{help_text}">'
+        f'<p style="margin:0;color:#666">{label}</p>'
+        f'<h2 style="margin:0">{value}</h2></div>'
+        for label, value, help_text in cards
+    )
+    return f'<div style="display:flex;gap:1rem">{card_html}</div>'
+
+@st.fragment
+def _status_panel():
+    """Sidebar session-status panel.
+
+    Runs as a fragment so toggling the debug checkbox or clearing session
+    state only reruns this panel, not the whole script.
+    """
+    # Bind session state once; each st.session_state.X access goes through
+    # the SessionStateProxy, so locals keep the rerun path cheap
+    pr = st.session_state.prediction_results
+    pd_ = st.session_state.patient_data
+    ml = st.session_state.model_loaded
+
+    # Fresh session: nothing loaded yet, so skip the status/debug work
+    if not (ml or pr or pd_):
+        return
+
+    # Session status indicator
+    st.subheader("📊 Session Status")
+
+    # Model status
+    if ml:
+        st.markdown(_STATUS_HTML['model_loaded'], unsafe_allow_html=True)
+    else:
+        st.markdown(_STATUS_HTML['model_warn'], unsafe_allow_html=True)
+
+    # Prediction status
+    if pr:
+        risk_level = pr.get('risk_level', 'Unknown')
+        probability = pr.get('probability_percent', 0)
+        st.markdown(f'<div class="status-indicator status-success">✅ Prediction Available<br>Risk: {probability:.1f}% ({risk_level})</div>',
+                   unsafe_allow_html=True)
+    else:
+        st.markdown(_STATUS_HTML['no_prediction'], unsafe_allow_html=True)
+
+    # Patient data status
+    if pd_:
+        age = pd_.get('age', 'Unknown')
+        gender = 'Male' if pd_.get('gender_male', 0) else 'Female'
+        st.markdown(f'<div class="status-indicator status-success">👤 Patient Data Available<br>Age: {age}, Gender: {gender}</div>',
+                   unsafe_allow_html=True)
+    else:
+        st.markdown(_STATUS_HTML['no_patient'], unsafe_allow_html=True)
+
+    st.divider()
+
+    # Debug panel (toggleable)
+    if st.checkbox("🔧 Show Debug Info"):
+        st.subheader("Debug Information")
+
+        st.write("**Session State Variables:**")
+        st.write(f"- prediction_results: {'✅ Set' if pr else '❌ None'}")
+        st.write(f"- patient_data: {'✅ Set' if pd_ else '❌ None'}")
+        st.write(f"- model_loaded: {'✅ True' if ml else '❌ False'}")
+
+        if st.button("🗑️ Clear Session State"):
+            st.session_state.prediction_results = None
+            st.session_state.patient_data = None
+            st.session_state.model_loaded = False
+            st.rerun()
+
+        # Only serialize the JSON dumps on demand; rendering them on every
+        # rerun of the debug panel re-pushes both dicts over the websocket
+        if st.button("📜 Render JSON"):
+            if pr:
+                st.write("**Prediction Results:**")
+                st.json(pr)
+
+            if pd_:
+                st.write("**Patient Data:**")
+                st.json(pd_)
 
 def main():
     """Main application function."""
-    
+
+    # Load the model once (cached) and keep the status flag in sync
+    model_handler = load_model()
+    st.session_state.model_loaded = model_handler is not None
+
     # Header
     st.markdown('<h1 class="main-header">🩺 Stroke Risk Assessment System</h1>', unsafe_allow_html=True)
-    
-    # Sidebar navigation
+
+    # Sidebar status (navigation links are rendered by st.navigation)
     with st.sidebar:
-        st.header("🧭 Navigation")
-        
-        # Navigation buttons
-        if st.button("🏠 Home", use_container_width=True):
-            st.switch_page("pages/home.py")
-        
-        if st.button("📊 Risk Assessment", use_container_width=True):
-            st.switch_page("pages/risk_assessment.py")
-        
-        if st.button("📈 Results", use_container_width=True):
-            if st.session_state.prediction_results:
-                st.switch_page("pages/results.py")
-            else:
-                st.error("Please complete risk assessment first!")
-        
-        if st.button("ℹ️ About", use_container_width=True):
-            st.switch_page("pages/about.py")
-        
-        st.divider()
-        
-        # Session status indicator
-        st.subheader("📊 Session Status")
-        
-        # Model status
-        if st.session_state.model_loaded:
-            st.markdown('<div class="status-indicator status-success">✅ Model Loaded</div>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-indicator status-warning">⚠️ Model Not Loaded</div>', 
-                       unsafe_allow_html=True)
-        
-        # Prediction status
-        if st.session_state.prediction_results:
-            risk_level = st.session_state.prediction_results.get('risk_level', 'Unknown')
-            probability = st.session_state.prediction_results.get('probability_percent', 0)
-            st.markdown(f'<div class="status-indicator status-success">✅ Prediction Available<br>Risk: {probability:.1f}% ({risk_level})</div>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-indicator status-info">📝 No Prediction Yet</div>', 
-                       unsafe_allow_html=True)
-        
-        # Patient data status
-        if st.session_state.patient_data:
-            age = st.session_state.patient_data.get('age', 'Unknown')
-            gender = 'Male' if st.session_state.patient_data.get('gender_male', 0) else 'Female'
-            st.markdown(f'<div class="status-indicator status-success">👤 Patient Data Available<br>Age: {age}, Gender: {gender}</div>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-indicator status-info">👤 No Patient Data</div>', 
-                       unsafe_allow_html=True)
-        
-        st.divider()
-        
-        # Debug panel (toggleable)
-        if st.checkbox("🔧 Show Debug Info"):
-            st.subheader("Debug Information")
-            
-            st.write("**Session State Variables:**")
-            st.write(f"- prediction_results: {'✅ Set' if st.session_state.prediction_results else '❌ None'}")
-            st.write(f"- patient_data: {'✅ Set' if st.session_state.patient_data else '❌ None'}")
-            st.write(f"- model_loaded: {'✅ True' if st.session_state.model_loaded else '❌ False'}")
-            
-            if st.button("🗑️ Clear Session State"):
-                st.session_state.prediction_results = None
-                st.session_state.patient_data = None
-                st.session_state.model_loaded = False
-                st.rerun()
-            
-            if st.session_state.prediction_results:
-                st.write("**Prediction Results:**")
-                st.json(st.session_state.prediction_results)
-            
-            if st.session_state.patient_data:
-                st.write("**Patient Data:**")
-                st.json(st.session_state.patient_data)
-    
+        _status_panel()
+
     # Main content area
     st.markdown("""
     ## Welcome to the Stroke Risk Assessment System
@@ -180,43 +175,42 @@ def main():
     - **Evidence-Based** - Trained on medical research data
     """)
     
-    # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
+    # Quick stats (single cached HTML row instead of four st.metric widgets)
+    st.markdown(_metrics_html(), unsafe_allow_html=True)
     
-    with col1:
-        st.metric("Model Accuracy", "85.4%", help="Area Under ROC Curve")
-    
-    with col2:
-        st.metric("Risk Factors", "12+", help="Medical and lifestyle factors analyzed")
-    
-    with col3:
-        st.metric("Predictions Made", "1,247", help="Total assessments completed")
-    
-    with col4:
-        st.metric("Processing Time", "<2s", help="Average prediction time")
-    
-    # Quick action buttons
+    # Quick action buttons, batched in a form so a click triggers a single
+    # rerun after submission instead of one per widget interaction
     st.markdown("### 🎯 Quick Actions")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🆕 New Assessment", use_container_width=True, type="primary"):
-            # Clear previous session data for new assessment
-            st.session_state.prediction_results = None
-            st.session_state.patient_data = None
-            st.switch_page("pages/risk_assessment.py")
-    
-    with col2:
-        if st.button("📋 View Last Results", use_container_width=True):
-            if st.session_state.prediction_results:
-                st.switch_page("pages/results.py")
-            else:
-                st.error("No previous assessment found!")
-    
-    with col3:
-        if st.button("📚 Learn More", use_container_width=True):
-            st.switch_page("pages/about.py")
+
+    with st.form("quick_actions", clear_on_submit=False, border=False):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            new_assessment = st.form_submit_button(
+                "🆕 New Assessment", use_container_width=True, type="primary")
+
+        with col2:
+            view_results = st.form_submit_button(
+                "📋 View Last Results", use_container_width=True)
+
+        with col3:
+            learn_more = st.form_submit_button(
+                "📚 Learn More", use_container_width=True)
+
+    if new_assessment:
+        # Clear previous session data for new assessment
+        st.session_state.prediction_results = None
+        st.session_state.patient_data = None
+        st.switch_page("pages/risk_assessment.py")
+
+    if view_results:
+        if st.session_state.prediction_results:
+            st.switch_page("pages/results.py")
+        else:
+            st.error("No previous assessment found!")
+
+    if learn_more:
+        st.switch_page("pages/about.py")
     
     # Important notes
     st.markdown("""
@@ -233,4 +227,7 @@ def main():
     """)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from router import build_navigation
+
+    nav = build_navigation(main)
+    nav.run()
\ No newline at end of file
@@ -2,222 +2,254 @@
 # Direct implementation to avoid recursion issues
 
 import streamlit as st
+import streamlit.components.v1 as components
 from datetime import datetime
 
-def show_about():
-    """Display the About page with help section and technical information"""
-    
-    st.title("ℹ️ About the Stroke Risk Prediction Tool")
-    
-    # Custom CSS for better styling
-    st.markdown("""
-    <style>
-    .info-box {
-        background-color: #e8f4fd;
-        border-left: 4px solid #1f77b4;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0.5rem;
-    }
-    .tech-box {
-        background-color: #f0f8f0;
-        border-left: 4px solid #28a745;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0.5rem;
-    }
-    .warning-box {
-        background-color: #fff8e1;
-        border-left: 4px solid #ff9800;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0.5rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Application Overview
-    st.markdown("## 🎯 Application Overview")
-    
-    st.markdown("""
+# Inline styles for the static HTML panels below; components.html renders in
+# an iframe, so the page-level CSS from styles.py does not reach them
+_PANEL_STYLE = """
+<style>
+    body { font-family: "Source Sans Pro", sans-serif; margin: 0; }
+    .info-box { background-color: #e8f4fd; border-left: 4px solid #1f77b4;
+                padding: 1rem; margin: 1rem 0; border-radius: 0.5rem; }
+    .tech-box { background-color: #f0f8f0; border-left: 4px solid #28a745;
+                padding: 1rem; margin: 1rem 0; border-radius: 0.5rem; flex: 1; }
+    .warning-box { background-color: #fff8e1; border-left: 4px solid #ff9800;
+                   padding: 1rem; margin: 1rem 0; border-radius: 0.5rem; }
+</style>
+"""
+
+
+@st.cache_data(persist="disk")
+def _overview_html():
+    """Static application-overview panel, built once."""
+    return _PANEL_STYLE + """
     <div class="info-box">
     <h4>🤖 AI-Powered Stroke Risk Assessment</h4>
-    <p>This application uses advanced machine learning algorithms to assess individual stroke risk based on demographic, 
-    medical, and lifestyle factors. The tool is designed to support healthcare professionals and inform patients about 
+    <p>This application uses advanced machine learning algorithms to assess individual stroke risk based on demographic,
+    medical, and lifestyle factors. The tool is designed to support healthcare professionals and inform patients about
     their cardiovascular health status.</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # How to Use Section
-    st.markdown("## 📋 How to Use This Tool")
-    
-    tab1, tab2, tab3 = st.tabs(["🔰 Getting Started", "📊 Understanding Results", "🏥 Next Steps"])
-    
-    with tab1:
+    """
+
+
+@st.cache_data(persist="disk")
+def _tech_info_html():
+    """Static technical-information panels, built once."""
+    return _PANEL_STYLE + """
+    <div style="display:flex;gap:1rem">
+        <div class="tech-box">
+        <h4>🤖 Machine Learning Model</h4>
+        <ul>
+            <li><strong>Algorithm:</strong> Calibrated ensemble model</li>
+            <li><strong>Training Data:</strong> 5,110 patient records</li>
+            <li><strong>Features:</strong> 27 engineered features</li>
+            <li><strong>Validation:</strong> Cross-validated performance</li>
+            <li><strong>Calibration:</strong> Probability calibration applied</li>
+        </ul>
+        </div>
+        <div class="tech-box">
+        <h4>📊 Model Performance</h4>
+        <ul>
+            <li><strong>AUC Score:</strong> &gt; 0.80</li>
+            <li><strong>Sensitivity:</strong> High detection rate</li>
+            <li><strong>Specificity:</strong> Low false positive rate</li>
+            <li><strong>Calibration:</strong> Well-calibrated probabilities</li>
+            <li><strong>Update Frequency:</strong> Model retrained quarterly</li>
+        </ul>
+        </div>
+    </div>
+    """
+
+
+@st.cache_data(persist="disk")
+def _disclaimer_html():
+    """Static medical-disclaimer panel, built once."""
+    return _PANEL_STYLE + """
+    <div class="warning-box">
+    <h4>🚨 MEDICAL DISCLAIMER</h4>
+    <ul>
+        <li><strong>Educational Purpose Only:</strong> This tool is for informational and educational purposes only</li>
+        <li><strong>Not Medical Advice:</strong> Results do not constitute professional medical advice, diagnosis, or treatment</li>
+        <li><strong>Consult Healthcare Providers:</strong> Always consult qualified medical professionals for health decisions</li>
+        <li><strong>Emergency Situations:</strong> Call emergency services immediately for stroke symptoms</li>
+        <li><strong>Individual Variation:</strong> Personal risk may differ from population-based estimates</li>
+        <li><strong>Accuracy Limitations:</strong> Model accuracy depends on input data quality and completeness</li>
+        <li><strong>Regular Updates:</strong> Health status changes; regular medical monitoring is essential</li>
+    </ul>
+    </div>
+    """
+
+# FAQ entries as a module constant; rendered with native <details> elements
+# so the browser handles expand/collapse without any Streamlit widget state
+FAQ_ITEMS = (
+    ("🤔 How accurate is the stroke risk prediction?", """
+        <p>The model achieves an AUC score &gt; 0.80, indicating good predictive performance. However, accuracy depends on:</p>
+        <ul>
+            <li>Quality and completeness of input data</li>
+            <li>Individual factors not captured in the model</li>
+            <li>Population similarity to training data</li>
+        </ul>
+        <p>Results should be interpreted as estimates and discussed with healthcare providers.</p>
+    """),
+    ("📊 What data does the model use for predictions?", """
+        <p>The model analyzes 27 engineered features including:</p>
+        <ul>
+            <li><strong>Demographics</strong>: Age, gender, marital status</li>
+            <li><strong>Medical History</strong>: Hypertension, heart disease</li>
+            <li><strong>Lifestyle Factors</strong>: Smoking status, work type</li>
+            <li><strong>Clinical Measurements</strong>: BMI, glucose levels</li>
+            <li><strong>Interaction Terms</strong>: Complex relationships between factors</li>
+        </ul>
+    """),
+    ("🔄 How often should I use this tool?", """
+        <p>Risk assessment frequency depends on your health status:</p>
+        <ul>
+            <li><strong>Healthy individuals</strong>: Annually or when health status changes</li>
+            <li><strong>Those with risk factors</strong>: Every 6 months or as recommended by healthcare provider</li>
+            <li><strong>High-risk patients</strong>: More frequent monitoring as advised by medical professionals</li>
+        </ul>
+        <p>Remember that health status can change, so regular reassessment is valuable.</p>
+    """),
+    ("🚨 What should I do if I'm classified as high risk?", """
+        <p>For high or very high risk classifications:</p>
+        <ol>
+            <li><strong>Immediate Action</strong>: Contact your healthcare provider</li>
+            <li><strong>Specialist Referral</strong>: Consider cardiology or neurology consultation</li>
+            <li><strong>Lifestyle Changes</strong>: Implement aggressive risk factor modification</li>
+            <li><strong>Regular Monitoring</strong>: Increase frequency of medical checkups</li>
+            <li><strong>Emergency Preparedness</strong>: Know stroke warning signs (F.A.S.T.)</li>
+        </ol>
+        <p>Don't panic, but take the results seriously and seek professional guidance.</p>
+    """),
+)
+
+
+@st.cache_data(persist="disk")
+def _faq_html():
+    """Static FAQ list built once from FAQ_ITEMS."""
+    return "".join(
+        f'<details style="margin:0.5rem 0"><summary style="cursor:pointer;font-weight:600">{q}</summary>{a}</details>'
+        for q, a in FAQ_ITEMS
+    )
+
+
+@st.fragment
+def _guide_section():
+    """How-to-use guide driven by a selectbox.
+
+    Only the selected section's markdown goes to the frontend (tabs render
+    all contents on every rerun), and the fragment scope keeps selection
+    changes from rerunning the whole page.
+    """
+    section = st.selectbox(
+        "Guide section",
+        ["🔰 Getting Started", "📊 Understanding Results", "🏥 Next Steps"]
+    )
+
+    if section == "🔰 Getting Started":
         st.markdown("""
         ### Step-by-Step Guide
-        
+
         1. **📝 Enter Patient Information**
            - Navigate to the "Risk Assessment" page
            - Fill in all required demographic information
            - Provide accurate medical history
            - Enter current clinical measurements
-        
+
         2. **✅ Data Validation**
            - The system automatically validates your inputs
            - Ensure all values are within reasonable medical ranges
            - Review any warnings or suggestions
-        
+
         3. **🔍 Generate Risk Assessment**
            - Click "Calculate Risk" to process the information
            - The AI model analyzes 27+ features
            - Results are generated in under 2 seconds
-        
+
         4. **📊 Review Results**
            - Examine your risk percentage and classification
            - Read personalized recommendations
            - Download or print results if needed
         """)
-    
-    with tab2:
+    elif section == "📊 Understanding Results":
         st.markdown("""
         ### Understanding Your Risk Score
-        
+
         **Risk Classifications:**
         - 🟢 **Low Risk (< 10%)**: Continue healthy lifestyle habits
         - 🟡 **Moderate Risk (10-30%)**: Consider prevention strategies
         - 🟠 **High Risk (30-60%)**: Seek medical consultation
         - 🔴 **Very High Risk (> 60%)**: Urgent medical attention needed
-        
+
         **Important Notes:**
         - Risk percentages are population-based estimates
         - Individual circumstances may vary
         - Results should be discussed with healthcare providers
         - Regular monitoring is recommended as health status changes
         """)
-    
-    with tab3:
+    else:
         st.markdown("""
         ### Recommended Next Steps
-        
+
         **For All Risk Levels:**
         - Share results with your healthcare provider
         - Discuss implications for your individual situation
         - Consider lifestyle modifications based on recommendations
-        
+
         **For High/Very High Risk:**
         - Schedule immediate medical consultation
         - Consider specialist referrals (cardiology/neurology)
         - Implement aggressive risk factor modification
         - Regular monitoring and follow-up care
-        
+
         **Emergency Situations:**
         - If experiencing stroke symptoms, call 911 immediately
         - Don't wait for risk assessment results in emergency situations
         """)
+
+@st.cache_data(ttl=3600)
+def _today_str():
+    """Cached date strings (month/day granularity), refreshed hourly."""
+    now = datetime.now()
+    return now.strftime('%b %Y'), now.strftime('%B %d, %Y')
+
+def show_about():
+    """Display the About page with help section and technical information"""
     
-    # Technical Information
-    st.markdown("---")
-    st.markdown("## 🔬 Technical Information")
+    st.title("ℹ️ About the Stroke Risk Prediction Tool")
+
+    month_year, full_date = _today_str()
     
-    col1, col2 = st.columns(2)
+    # Page styling comes from the app-wide stylesheet injected by app.py
+
+    # Application Overview
+    st.markdown("## 🎯 Application Overview")
     
-    with col1:
-        st.markdown("""
-        <div class="tech-box">
-        <h4>🤖 Machine Learning Model</h4>
-        <ul>
-            <li><strong>Algorithm:</strong> Calibrated ensemble model</li>
-            <li><strong>Training Data:</strong> 5,110 patient records</li>
-            <li><strong>Features:</strong> 27 engineered features</li>
-            <li><strong>Validation:</strong> Cross-validated performance</li>
-            <li><strong>Calibration:</strong> Probability calibration applied</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    components.html(_overview_html(), height=180)
     
-    with col2:
-        st.markdown("""
-        <div class="tech-box">
-        <h4>📊 Model Performance</h4>
-        <ul>
-            <li><strong>AUC Score:</strong> > 0.80</li>
-            <li><strong>Sensitivity:</strong> High detection rate</li>
-            <li><strong>Specificity:</strong> Low false positive rate</li>
-            <li><strong>Calibration:</strong> Well-calibrated probabilities</li>
-            <li><strong>Update Frequency:</strong> Model retrained quarterly</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Important Disclaimers
-    st.markdown("---")
-    st.markdown("## ⚠️ Important Disclaimers & Limitations")
+    # How to Use Section
+    st.markdown("## 📋 How to Use This Tool")
     
-    st.markdown("""
-    <div class="warning-box">
-    <h4>🚨 MEDICAL DISCLAIMER</h4>
-    <ul>
-        <li><strong>Educational Purpose Only:</strong> This tool is for informational and educational purposes only</li>
-        <li><strong>Not Medical Advice:</strong> Results do not constitute professional medical advice, diagnosis, or treatment</li>
-        <li><strong>Consult Healthcare Providers:</strong> Always consult qualified medical professionals for health decisions</li>
-        <li><strong>Emergency Situations:</strong> Call emergency services immediately for stroke symptoms</li>
-        <li><strong>Individual Variation:</strong> Personal risk may differ from population-based estimates</li>
-        <li><strong>Accuracy Limitations:</strong> Model accuracy depends on input data quality and completeness</li>
-        <li><strong>Regular Updates:</strong> Health status changes; regular medical monitoring is essential</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    _guide_section()
+
+    # Technical Information
+    st.markdown("---\n## 🔬 Technical Information")
     
-    # Frequently Asked Questions
-    st.markdown("---")
-    st.markdown("## ❓ Frequently Asked Questions")
+    components.html(_tech_info_html(), height=280)
     
-    with st.expander("🤔 How accurate is the stroke risk prediction?"):
-        st.markdown("""
-        The model achieves an AUC score > 0.80, indicating good predictive performance. However, accuracy depends on:
-        - Quality and completeness of input data
-        - Individual factors not captured in the model
-        - Population similarity to training data
-        
-        Results should be interpreted as estimates and discussed with healthcare providers.
-        """)
+    # Important Disclaimers
+    st.markdown("---\n## ⚠️ Important Disclaimers & Limitations")
     
-    with st.expander("📊 What data does the model use for predictions?"):
-        st.markdown("""
-        The model analyzes 27 engineered features including:
-        - **Demographics**: Age, gender, marital status
-        - **Medical History**: Hypertension, heart disease
-        - **Lifestyle Factors**: Smoking status, work type
-        - **Clinical Measurements**: BMI, glucose levels
-        - **Interaction Terms**: Complex relationships between factors
-        """)
+    components.html(_disclaimer_html(), height=320)
     
-    with st.expander("🔄 How often should I use this tool?"):
-        st.markdown("""
-        Risk assessment frequency depends on your health status:
-        - **Healthy individuals**: Annually or when health status changes
-        - **Those with risk factors**: Every 6 months or as recommended by healthcare provider
-        - **High-risk patients**: More frequent monitoring as advised by medical professionals
-        
-        Remember that health status can change, so regular reassessment is valuable.
-        """)
+    # Frequently Asked Questions
+    st.markdown("---\n## ❓ Frequently Asked Questions")
     
-    with st.expander("🚨 What should I do if I'm classified as high risk?"):
-        st.markdown("""
-        For high or very high risk classifications:
-        1. **Immediate Action**: Contact your healthcare provider
-        2. **Specialist Referral**: Consider cardiology or neurology consultation
-        3. **Lifestyle Changes**: Implement aggressive risk factor modification
-        4. **Regular Monitoring**: Increase frequency of medical checkups
-        5. **Emergency Preparedness**: Know stroke warning signs (F.A.S.T.)
-        
-        Don't panic, but take the results seriously and seek professional guidance.
-        """)
+    st.markdown(_faq_html(), unsafe_allow_html=True)
     
     # Contact Information
-    st.markdown("---")
-    st.markdown("## 📞 Support & Contact")
+    st.markdown("---\n## 📞 Support & Contact")
     
     col1, col2 = st.columns(2)
     
@@ -238,8 +270,7 @@ def show_about():
         """)
     
     # Version Information
-    st.markdown("---")
-    st.markdown("## 📋 Version Information")
+    st.markdown("---\n## 📋 Version Information")
     
     col1, col2, col3 = st.columns(3)
     
@@ -248,7 +279,7 @@ def show_about():
     with col2:
         st.metric("Model Version", "v2.1")
     with col3:
-        st.metric("Last Updated", datetime.now().strftime("%b %Y"))
+        st.metric("Last Updated", month_year)
     
     # Footer
     st.markdown("---")
@@ -256,7 +287,7 @@ def show_about():
     <div style="text-align: center; color: #666666; padding: 1rem;">
         <p><strong>Stroke Risk Prediction Tool</strong> | Version 1.0</p>
         <p>Built with ❤️ for better healthcare outcomes</p>
-        <p>Last updated: {datetime.now().strftime('%B %d, %Y')}</p>
+        <p>Last updated: {full_date}</p>
     </div>
     """, unsafe_allow_html=True)
 
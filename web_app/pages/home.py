@@ -1,58 +1,21 @@
 import streamlit as st
-import plotly.graph_objects as go
 from datetime import datetime
 
+@st.cache_data(ttl=3600)
+def _month_year():
+    """Cached footer date string (month granularity), refreshed hourly."""
+    return datetime.now().strftime('%B %Y')
+
 def show_home():
-    """Display the home/landing page with app introduction and disclaimers"""
-    
-    # Page configuration
-    st.set_page_config(
-        page_title="Stroke Risk Prediction",
-        page_icon="🏥",
-        layout="wide",
-        initial_sidebar_state="collapsed"
-    )
-    
-    # Custom CSS for better styling
-    st.markdown("""
-    <style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: 700;
-        text-align: center;
-        color: #1f4e79;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        text-align: center;
-        color: #666666;
-        margin-bottom: 2rem;
-    }
-    .feature-box {
-        background-color: #f8f9fa;
-        border-left: 4px solid #007bff;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0.5rem;
-    }
-    .disclaimer-box {
-        background-color: #fff3cd;
-        border: 2px solid #ffc107;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0.5rem;
-    }
-    .stats-box {
-        background-color: #e7f3ff;
-        border: 1px solid #007bff;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        text-align: center;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
+    """Display the home/landing page with app introduction and disclaimers
+
+    Page configuration is owned by the app entry point (app.py); calling
+    st.set_page_config here again would be a wasted call at best and an
+    exception when rendered as a child page.
+    """
+
+    # Page styling comes from the app-wide stylesheet injected by app.py
+
     # Main header
     st.markdown("""
     <div class="main-header">
@@ -63,40 +26,30 @@ def show_home():
     </div>
     """, unsafe_allow_html=True)
     
-    # Hero section with key stats
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="stats-box">
+    # Hero section with key stats (static, so one markdown call instead of
+    # three columns each emitting their own delta)
+    st.markdown("""
+    <div style="display:flex;gap:1rem">
+        <div class="stats-box" style="flex:1">
             <h3>🧠 About Stroke</h3>
             <p><strong>2nd</strong> leading cause of death globally</p>
             <p><strong>795,000</strong> strokes occur in the US annually</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="stats-box">
+        <div class="stats-box" style="flex:1">
             <h3>⏱️ Time Critical</h3>
             <p><strong>Every minute</strong> counts in stroke prevention</p>
             <p><strong>Early detection</strong> saves lives</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="stats-box">
+        <div class="stats-box" style="flex:1">
             <h3>🎯 Prevention</h3>
             <p><strong>80%</strong> of strokes are preventable</p>
             <p><strong>Risk assessment</strong> enables prevention</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
+    </div>
+    """, unsafe_allow_html=True)
     
     # App introduction
-    st.markdown("## 🎯 What is This Tool?")
+    st.markdown("---\n## 🎯 What is This Tool?")
     
     st.markdown("""
     <div class="feature-box">
@@ -147,8 +100,7 @@ def show_home():
         """)
     
     # How it works section
-    st.markdown("---")
-    st.markdown("## 🔄 How It Works")
+    st.markdown("---\n## 🔄 How It Works")
     
     # Process flow
     process_steps = [
@@ -159,20 +111,15 @@ def show_home():
         ("🏥 Recommendations", "Personalized clinical guidance and next steps")
     ]
     
-    for i, (title, description) in enumerate(process_steps, 1):
-        with st.container():
-            col1, col2, col3 = st.columns([1, 6, 1])
-            with col2:
-                st.markdown(f"""
-                <div class="feature-box">
-                <h4>Step {i}: {title}</h4>
-                <p>{description}</p>
-                </div>
-                """, unsafe_allow_html=True)
+    # Emit all five steps in one markdown call instead of 5x(container+columns)
+    steps_html = "".join(
+        f'<div class="feature-box"><h4>Step {i}: {title}</h4><p>{description}</p></div>'
+        for i, (title, description) in enumerate(process_steps, 1)
+    )
+    st.markdown(f'<div class="process-steps">{steps_html}</div>', unsafe_allow_html=True)
     
     # Important disclaimers
-    st.markdown("---")
-    st.markdown("## ⚠️ Important Medical Disclaimers")
+    st.markdown("---\n## ⚠️ Important Medical Disclaimers")
     
     st.markdown("""
     <div class="disclaimer-box">
@@ -246,7 +193,7 @@ def show_home():
     st.markdown("---")
     st.markdown(f"""
     <div style="text-align: center; color: #666666; font-size: 0.9rem;">
-    <p>Stroke Risk Prediction Tool v1.0 | Last Updated: {datetime.now().strftime('%B %Y')}</p>
+    <p>Stroke Risk Prediction Tool v1.0 | Last Updated: {_month_year()}</p>
     <p>For healthcare professionals and informed patients | Educational use only</p>
     </div>
     """, unsafe_allow_html=True)
@@ -1,10 +1,9 @@
 # Updated pages/results.py with dynamic values and proper session state usage
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 import numpy as np
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from typing import NamedTuple
 
 # Page configuration
 st.set_page_config(
@@ -13,8 +12,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for results page
-st.markdown("""
+# Custom CSS for results page, kept as a module constant and handed out by a
+# cached accessor so the ~2KB blob is materialized once per process
+_RESULTS_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -82,11 +82,92 @@ st.markdown("""
         border: 1px solid #f5c6cb;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
+@st.cache_resource
+def _page_css():
+    return _RESULTS_CSS
+
+st.html(_page_css())
+
+# Risk-level lookup tables, built once at import instead of on every rerun
+RISK_CLASSES = {
+    'Low Risk': 'risk-low',
+    'Moderate Risk': 'risk-medium',
+    'High Risk': 'risk-high',
+    'Very High Risk': 'risk-very-high'
+}
+
+RISK_EMOJIS = {
+    'Low Risk': '🟢',
+    'Moderate Risk': '🟡',
+    'High Risk': '🟠',
+    'Very High Risk': '🔴'
+}
+
+# Maps the model's risk label to its 0-3 population-chart bucket
+RISK_BUCKET = {
+    'Low Risk': 0,
+    'Moderate Risk': 1,
+    'High Risk': 2,
+    'Very High Risk': 3
+}
+
+POP_CATEGORIES = ['Low<br>(0-5%)', 'Medium<br>(5-15%)', 'High<br>(15-30%)', 'Very High<br>(30%+)']
+POP_PCT = [70, 20, 8, 2]
+
+# Pre-parsed metric-card template: format_map only substitutes the dynamic
+# fields instead of rebuilding the constant HTML segments per rerun
+METRIC_CARD_TPL = '<div class="metric-card {cls}"><h3>{h}</h3><h1>{v}</h1><p>{p}</p></div>'
+
+# Status labels resolved by bisect on the sorted thresholds instead of
+# chained if/elif comparisons
+BMI_THRESHOLDS = (25, 30)
+BMI_LABELS = ("✅ Normal", "↗️ Overweight", "↗️ Obese")
+GLUCOSE_THRESHOLDS = (100, 125)
+GLUCOSE_LABELS = ("✅ Normal", "⚠️ Pre-diabetic", "↗️ Diabetic")
+
+class PatientView(NamedTuple):
+    """Immutable snapshot of the patient fields this page reads.
+
+    Materialized once per rerun from the session-state dict so the display
+    functions get plain attribute access instead of repeated patient.get()
+    dictionary lookups; being a tuple it's also hashable, so it doubles as
+    the cache key for the functions below.
+    """
+    age: float
+    gender: str
+    hypertension: int
+    heart_disease: int
+    avg_glucose_level: float
+    bmi: float
+    smoking_status: str
+
+    @classmethod
+    def from_session(cls, patient: dict) -> "PatientView":
+        return cls(
+            patient.get('age', 0),
+            patient.get('gender', 'Unknown'),
+            patient.get('hypertension', 0),
+            patient.get('heart_disease', 0),
+            patient.get('avg_glucose_level', 0),
+            patient.get('bmi', 0),
+            patient.get('smoking_status', ''),
+        )
+
+@st.cache_data(max_entries=128, show_spinner=False)
 def create_risk_gauge(probability_percent, risk_level):
-    """Create dynamic risk gauge meter using actual prediction results."""
-    
+    """Create dynamic risk gauge meter using actual prediction results.
+
+    Cached on (probability, risk_level) so reruns with unchanged results skip
+    Plotly figure construction; returns a plain dict because go.Figure isn't
+    hashable/serializable for the cache — rebuild with go.Figure(...) at the
+    call site.
+    """
+    # Deferred import: the no-prediction error path never needs plotly, so
+    # first navigation there skips the module load entirely
+    import plotly.graph_objects as go
+
     # CRITICAL FIX 3: Use dynamic values instead of hardcoded 0.1
     fig = go.Figure(go.Indicator(
         mode = "gauge+number+delta",
@@ -132,297 +213,276 @@ def create_risk_gauge(probability_percent, risk_level):
         font={'color': "darkblue", 'family': "Arial"},
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
-        margin=dict(l=20, r=20, t=40, b=20)
+        margin=dict(l=20, r=20, t=40, b=20),
+        # Stable uirevision lets Plotly.js diff-patch instead of newPlot
+        uirevision="results-page"
     )
-    
-    return fig
 
-def display_patient_summary():
-    """Display patient summary using session state data."""
-    
-    st.markdown('<h2>👤 Patient Summary</h2>', unsafe_allow_html=True)
-    
-    # CRITICAL FIX 4: Use session state patient data instead of form inputs
-    if st.session_state.patient_data:
-        patient = st.session_state.patient_data
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            age = patient.get('age', 'Unknown')
-            st.metric("Age", f"{age:.0f} years")
-        
-        with col2:
-            gender = patient.get('gender', 'Unknown')
-            st.metric("Gender", gender)
-        
-        with col3:
-            bmi = patient.get('bmi', 0)
-            if bmi >= 30:
-                bmi_status = "↗️ Obese"
-            elif bmi >= 25:
-                bmi_status = "↗️ Overweight"
-            else:
-                bmi_status = "✅ Normal"
-            st.metric("BMI", f"{bmi:.1f}", delta=bmi_status)
-        
-        with col4:
-            glucose = patient.get('avg_glucose_level', 0)
-            if glucose > 125:
-                glucose_status = "↗️ Diabetic"
-            elif glucose > 100:
-                glucose_status = "⚠️ Pre-diabetic"
-            else:
-                glucose_status = "✅ Normal"
-            st.metric("Glucose", f"{glucose:.0f} mg/dL", delta=glucose_status)
-    
-    else:
-        st.error("❌ No patient data found. Please complete the risk assessment first.")
+    return fig.to_dict()
+
+def classify(age, bmi, glucose, hypertension, heart_disease):
+    """Vectorized clinical-threshold classification.
+
+    Accepts scalars or equal-length arrays, so a future batch path (e.g.
+    scoring an uploaded CSV of patients for cohort comparison) can reuse it
+    unchanged — NumPy broadcasts the comparisons across the whole cohort in
+    C instead of looping the if/elif chains per row.
+
+    Returns the five threshold flags plus the modifiable-factor count
+    (hypertension, diabetes, excess weight).
+    """
+    age = np.asarray(age, dtype=np.float64)
+    bmi = np.asarray(bmi, dtype=np.float64)
+    glucose = np.asarray(glucose, dtype=np.float64)
+    hypertension = np.asarray(hypertension, dtype=bool)
+
+    is_elderly = age >= 65
+    is_obese = bmi >= 30
+    is_overweight = bmi >= 25
+    is_diabetic = glucose > 125
+    is_prediabetic = glucose > 100
+
+    modifiable_count = (hypertension.astype(np.int8)
+                        + is_diabetic + is_overweight)
+
+    return (is_elderly, is_obese, is_overweight,
+            is_diabetic, is_prediabetic, modifiable_count)
+
+@st.cache_data(show_spinner=False)
+def compute_risk_flags(view: PatientView):
+    """Evaluate all clinical thresholds once for a patient.
+
+    Takes a hashable PatientView so the result is cacheable; the display
+    functions read the precomputed booleans instead of re-running a dozen
+    threshold comparisons per rerun. Delegates the threshold math to the
+    vectorized classify() core.
+    """
+    hypertension, heart_disease = view.hypertension, view.heart_disease
+    smoking = view.smoking_status
+
+    is_elderly, is_obese, is_overweight, is_diabetic, is_prediabetic, _ = classify(
+        view.age, view.bmi, view.avg_glucose_level, hypertension, heart_disease)
 
-def display_risk_analysis():
+    modifiable_factors = []
+    if hypertension:
+        modifiable_factors.append("Hypertension")
+    if is_diabetic:
+        modifiable_factors.append("Diabetes")
+    if is_obese:
+        modifiable_factors.append("Obesity")
+    elif is_overweight:
+        modifiable_factors.append("Overweight")
+
+    current_smoker = 'smokes' in smoking
+    former_smoker = 'formerly' in smoking
+
+    # Present-risk-factor bullet list, built here once so both the count in
+    # display_risk_analysis and the list in display_risk_factors come from
+    # the same cached classification and cannot drift apart
+    present_factors = []
+    if is_elderly:
+        present_factors.append(f"• **Advanced age** ({view.age:.0f} years)")
+    if hypertension:
+        present_factors.append("• **Hypertension** (High blood pressure)")
+    if heart_disease:
+        present_factors.append("• **Heart disease**")
+    if is_diabetic:
+        present_factors.append(f"• **Diabetes** (Glucose: {view.avg_glucose_level:.0f} mg/dL)")
+    elif is_prediabetic:
+        present_factors.append(f"• **Pre-diabetes** (Glucose: {view.avg_glucose_level:.0f} mg/dL)")
+    if is_obese:
+        present_factors.append(f"• **Obesity** (BMI: {view.bmi:.1f})")
+    elif is_overweight:
+        present_factors.append(f"• **Overweight** (BMI: {view.bmi:.1f})")
+    if current_smoker:
+        present_factors.append("• **Current smoking**")
+    elif former_smoker:
+        present_factors.append("• **Former smoking history**")
+
+    return {
+        'is_elderly': bool(is_elderly),
+        'is_obese': bool(is_obese),
+        'is_overweight': bool(is_overweight),
+        'is_diabetic': bool(is_diabetic),
+        'is_prediabetic': bool(is_prediabetic),
+        'has_hypertension': bool(hypertension),
+        'has_heart_disease': bool(heart_disease),
+        'current_smoker': current_smoker,
+        'former_smoker': former_smoker,
+        'modifiable_factors': modifiable_factors,
+        'modifiable_count': len(modifiable_factors),
+        'present_factors_md': "\n\n".join(present_factors),
+    }
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_population_fig(bucket_idx):
+    """Population-comparison bar chart, cached on the 0-3 risk bucket index.
+
+    Only four variants exist, so after the first rerun this is a pure cache
+    hit. Returns a dict for the same cacheability reason as the gauge.
+    """
+    import plotly.graph_objects as go
+
+    patient_data = [0, 0, 0, 0]
+    if bucket_idx is not None:
+        patient_data[bucket_idx] = 100
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Population Average (%)',
+        x=POP_CATEGORIES,
+        y=POP_PCT,
+        marker_color='lightblue',
+        opacity=0.7,
+        text=POP_PCT,
+        textposition='auto'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Current Patient',
+        x=POP_CATEGORIES,
+        y=patient_data,
+        marker_color='red',
+        opacity=0.8,
+        text=['You' if x > 0 else '' for x in patient_data],
+        textposition='auto'
+    ))
+
+    fig.update_layout(
+        title="Population Risk Distribution",
+        xaxis_title="Risk Category",
+        yaxis_title="Percentage",
+        barmode='overlay',
+        height=350,
+        showlegend=True,
+        uirevision="results-page"
+    )
+
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _patient_summary_html(view: PatientView):
+    """Patient-summary card row as a single HTML string.
+
+    One markdown delta instead of a four-column layout plus four st.metric
+    widgets (each of which is its own delta message to the frontend).
+    """
+    # bisect_right for the inclusive BMI cutoffs (>=), bisect_left for the
+    # strict glucose cutoffs (>) so the boundary values classify as before
+    bmi_status = BMI_LABELS[bisect_right(BMI_THRESHOLDS, view.bmi)]
+    glucose_status = GLUCOSE_LABELS[bisect_left(GLUCOSE_THRESHOLDS, view.avg_glucose_level)]
+
+    cards = [
+        ("Age", f"{view.age:.0f} years", ""),
+        ("Gender", view.gender, ""),
+        ("BMI", f"{view.bmi:.1f}", bmi_status),
+        ("Glucose", f"{view.avg_glucose_level:.0f} mg/dL", glucose_status),
+    ]
+
+    card_html = "".join(
+        f'<div class="metric-card" style="flex:1;text-align:center;margin:0">'
+        f'<p style="margin:0;color:#666">{label}</p>'
+        f'<h2 style="margin:0">{value}</h2>'
+        f'<p style="margin:0;font-size:0.9rem">{delta}</p></div>'
+        for label, value, delta in cards
+    )
+    return f'<div style="display:flex;gap:1rem">{card_html}</div>'
+
+def display_patient_summary(view: PatientView):
+    """Display patient summary for the materialized patient view."""
+
+    st.html('<h2>👤 Patient Summary</h2>' + _patient_summary_html(view))
+
+def display_risk_analysis(results):
     """Display risk analysis using dynamic prediction results."""
-    
-    st.markdown('<h2>📊 Risk Analysis Summary</h2>', unsafe_allow_html=True)
-    
-    # CRITICAL FIX 5: Check if prediction results exist
-    if not st.session_state.prediction_results:
-        st.error("❌ No prediction results found. Please complete the risk assessment first.")
-        if st.button("📊 Go to Risk Assessment", use_container_width=True):
-            st.switch_page("pages/risk_assessment.py")
-        return
-    
-    # Get results from session state
-    results = st.session_state.prediction_results
-    patient = st.session_state.patient_data
-    
+    import plotly.graph_objects as go
+
+    st.html('<h2>📊 Risk Analysis Summary</h2>')
+
     # DYNAMIC risk values (not hardcoded!)
     probability_percent = results.get('probability_percent', 0)
     risk_level = results.get('risk_level', 'Unknown')
     
-    # Risk level styling
-    risk_classes = {
-        'Low Risk': 'risk-low',
-        'Moderate Risk': 'risk-medium',
-        'High Risk': 'risk-high',
-        'Very High Risk': 'risk-very-high'
-    }
-    
-    risk_emojis = {
-        'Low Risk': '🟢',
-        'Moderate Risk': '🟡',
-        'High Risk': '🟠',
-        'Very High Risk': '🔴'
-    }
-    
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # CRITICAL FIX 6: Dynamic gauge meter
-        fig = create_risk_gauge(probability_percent, risk_level)
-        st.plotly_chart(fig, use_container_width=True)
+        # CRITICAL FIX 6: Dynamic gauge meter (rounded to 1dp for cache hits)
+        fig = go.Figure(create_risk_gauge(round(probability_percent, 1), risk_level))
+        # staticPlot: neither chart needs hover/zoom, so skip the client-side
+        # interaction handler wiring entirely
+        st.plotly_chart(fig, use_container_width=True, config={'staticPlot': True})
     
     with col2:
-        # CRITICAL FIX 7: Dynamic risk probability display
-        risk_class = risk_classes.get(risk_level, '')
-        st.markdown(f"""
-        <div class="metric-card {risk_class}">
-            <h3>Risk Probability</h3>
-            <h1>{probability_percent:.1f}%</h1>
-            <p>vs. 4.9% population average</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # CRITICAL FIX 8: Dynamic risk classification
-        risk_emoji = risk_emojis.get(risk_level, '⚪')
-        st.markdown(f"""
-        <div class="metric-card {risk_class}">
-            <h3>Risk Classification</h3>
-            <h2>{risk_emoji} {risk_level} Risk</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # CRITICAL FIX 9: Dynamic modifiable risk factors count
-        modifiable_count = 0
-        modifiable_factors = []
-        
-        if patient.get('hypertension', 0):
-            modifiable_count += 1
-            modifiable_factors.append("Hypertension")
-        
-        if patient.get('avg_glucose_level', 0) > 125:
-            modifiable_count += 1
-            modifiable_factors.append("Diabetes")
-        
-        if patient.get('bmi', 0) >= 30:
-            modifiable_count += 1
-            modifiable_factors.append("Obesity")
-        elif patient.get('bmi', 0) >= 25:
-            modifiable_count += 1
-            modifiable_factors.append("Overweight")
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Modifiable Risk Factors</h3>
-            <h2>{modifiable_count}/3</h2>
-            <p>↗️ Focus areas for prevention</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_risk_factors():
+        risk_class = RISK_CLASSES.get(risk_level, '')
+        risk_emoji = RISK_EMOJIS.get(risk_level, '⚪')
+        modifiable_count = st.session_state.risk_flags['modifiable_count']
+
+        # All three metric cards in one st.html call: each call is its own
+        # ForwardMsg over the websocket, so joining saves two round trips
+        st.html("".join([
+            METRIC_CARD_TPL.format_map({
+                'cls': risk_class,
+                'h': 'Risk Probability',
+                'v': f"{probability_percent:.1f}%",
+                'p': 'vs. 4.9% population average',
+            }),
+            METRIC_CARD_TPL.format_map({
+                'cls': risk_class,
+                'h': 'Risk Classification',
+                'v': f"{risk_emoji} {risk_level}",
+                'p': '',
+            }),
+            METRIC_CARD_TPL.format_map({
+                'cls': '',
+                'h': 'Modifiable Risk Factors',
+                'v': f"{modifiable_count}/3",
+                'p': '↗️ Focus areas for prevention',
+            }),
+        ]))
+
+def display_risk_factors(view: PatientView, results):
     """Display detailed risk factor analysis."""
-    
-    st.markdown('<h2>📈 Risk Factor Analysis</h2>', unsafe_allow_html=True)
-    
-    if not st.session_state.patient_data or not st.session_state.prediction_results:
-        st.error("No patient data or prediction results available.")
-        return
-    
-    patient = st.session_state.patient_data
-    results = st.session_state.prediction_results
-    
+    import plotly.graph_objects as go
+
+    st.html('<h2>📈 Risk Factor Analysis</h2>')
+
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Present Risk Factors")
-        
-        risk_factors = []
-        
-        # Age factor
-        age = patient.get('age', 0)
-        if age >= 65:
-            risk_factors.append(f"• **Advanced age** ({age:.0f} years)")
-        
-        # Medical conditions
-        if patient.get('hypertension', 0):
-            risk_factors.append("• **Hypertension** (High blood pressure)")
-        
-        if patient.get('heart_disease', 0):
-            risk_factors.append("• **Heart disease**")
-        
-        # Metabolic factors
-        glucose = patient.get('avg_glucose_level', 0)
-        if glucose > 125:
-            risk_factors.append(f"• **Diabetes** (Glucose: {glucose:.0f} mg/dL)")
-        elif glucose > 100:
-            risk_factors.append(f"• **Pre-diabetes** (Glucose: {glucose:.0f} mg/dL)")
-        
-        # BMI factors
-        bmi = patient.get('bmi', 0)
-        if bmi >= 30:
-            risk_factors.append(f"• **Obesity** (BMI: {bmi:.1f})")
-        elif bmi >= 25:
-            risk_factors.append(f"• **Overweight** (BMI: {bmi:.1f})")
-        
-        # Smoking status
-        smoking = patient.get('smoking_status', '')
-        if 'smokes' in smoking or smoking == 'currently_smokes':
-            risk_factors.append("• **Current smoking**")
-        elif 'formerly' in smoking or smoking == 'formerly_smoked':
-            risk_factors.append("• **Former smoking history**")
-        
-        if risk_factors:
-            for factor in risk_factors:
-                st.markdown(factor)
+
+        # The bullet list was prebuilt alongside the flags, so this section
+        # and the modifiable-count card always agree
+        present_factors_md = st.session_state.risk_flags['present_factors_md']
+
+        if present_factors_md:
+            st.markdown(present_factors_md)
         else:
             st.success("✅ No major risk factors identified")
     
     with col2:
         st.subheader("Risk Level Comparison")
-        
-        # Population comparison chart
-        categories = ['Low<br>(0-5%)', 'Medium<br>(5-15%)', 'High<br>(15-30%)', 'Very High<br>(30%+)']
-        population_pct = [70, 20, 8, 2]
-        
+
         # Determine where current patient falls
-        prob = results.get('probability_percent', 0)
         risk_level = results.get('risk_level', 'Unknown')  # ← FIX: Get risk_level from results
-        patient_data = [0, 0, 0, 0]
-        if 'Low' in risk_level:
-            patient_data[0] = 100
-        elif 'Moderate' in risk_level:
-            patient_data[1] = 100
-        elif 'High Risk' in risk_level:  # Not "Very High"
-            patient_data[2] = 100
-        elif 'Very High' in risk_level:
-            patient_data[3] = 100
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            name='Population Average (%)',
-            x=categories,
-            y=population_pct,
-            marker_color='lightblue',
-            opacity=0.7,
-            text=population_pct,
-            textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='Current Patient',
-            x=categories,
-            y=patient_data,
-            marker_color='red',
-            opacity=0.8,
-            text=['You' if x > 0 else '' for x in patient_data],
-            textposition='auto'
-        ))
-        
-        fig.update_layout(
-            title="Population Risk Distribution",
-            xaxis_title="Risk Category",
-            yaxis_title="Percentage",
-            barmode='overlay',
-            height=350,
-            showlegend=True
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        bucket_idx = RISK_BUCKET.get(risk_level)
 
-def display_recommendations():
-    """Display personalized recommendations based on patient data."""
-    
-    st.markdown('<h2>💡 Personalized Recommendations</h2>', unsafe_allow_html=True)
-    
-    if not st.session_state.patient_data:
-        st.error("No patient data available for recommendations.")
-        return
-    
-    patient = st.session_state.patient_data
-    results = st.session_state.prediction_results
-    
-    # Risk-based alert
-    risk_level = results.get('risk_level', 'Unknown')
-    probability = results.get('probability_percent', 0)
-    
-    if 'Very High' in risk_level:
-        alert_class = "alert-danger"
-        alert_icon = "🚨"
-        alert_text = "Very High Risk - Immediate medical consultation recommended"
-    elif 'High' in risk_level:
-        alert_class = "alert-warning"
-        alert_icon = "⚠️"
-        alert_text = "High Risk - Comprehensive evaluation and prevention plan needed"
-    elif 'Moderate' in risk_level:
-        alert_class = "alert-warning"
-        alert_icon = "⚠️"
-        alert_text = "Moderate Risk - Preventive measures and lifestyle changes recommended"
-    else:
-        alert_class = "alert-success"
-        alert_icon = "✅"
-        alert_text = "Low Risk - Continue healthy lifestyle practices"
-    
-    st.markdown(f"""
-    <div class="{alert_class}">
-        {alert_icon} {alert_text}
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Specific recommendations
+        fig = go.Figure(_build_population_fig(bucket_idx))
+        st.plotly_chart(fig, use_container_width=True, config={'staticPlot': True})
+
+@st.cache_data(show_spinner=False)
+def build_recommendations_html(view: PatientView):
+    """Assemble the full personalized-recommendations HTML for a patient.
+
+    Cached on the same PatientView key as compute_risk_flags; the whole block
+    is emitted in one st.markdown call instead of one per bullet.
+    """
+    flags = compute_risk_flags(view)
     recommendations = []
-    
+
     # Age-based recommendations
-    if patient.get('age', 0) >= 65:
+    if flags['is_elderly']:
         recommendations.append({
             'category': 'Age-Related Care',
             'items': [
@@ -431,54 +491,52 @@ def display_recommendations():
                 "Coordination with geriatric care specialists"
             ]
         })
-    
+
     # Condition-based recommendations
     medical_recs = []
-    if patient.get('hypertension', 0):
+    if flags['has_hypertension']:
         medical_recs.extend([
             "Blood pressure monitoring and management",
             "Antihypertensive medication review with physician",
             "Dietary sodium reduction (<2300mg/day)"
         ])
-    
-    if patient.get('heart_disease', 0):
+
+    if flags['has_heart_disease']:
         medical_recs.extend([
             "Cardiology consultation for comprehensive care",
             "Cardiac risk factor optimization",
             "Regular EKG and echocardiogram monitoring"
         ])
-    
+
     if medical_recs:
         recommendations.append({
             'category': 'Medical Management',
             'items': medical_recs
         })
-    
+
     # Metabolic recommendations
     metabolic_recs = []
-    glucose = patient.get('avg_glucose_level', 0)
-    if glucose > 125:
+    if flags['is_diabetic']:
         metabolic_recs.extend([
             "Diabetes management and blood glucose monitoring",
             "HbA1c testing every 3-6 months",
             "Diabetic diet consultation"
         ])
-    elif glucose > 100:
+    elif flags['is_prediabetic']:
         metabolic_recs.extend([
             "Pre-diabetes monitoring and prevention",
             "Glucose tolerance testing",
             "Dietary modification to prevent diabetes"
         ])
-    
+
     if metabolic_recs:
         recommendations.append({
             'category': 'Metabolic Health',
             'items': metabolic_recs
         })
-    
+
     # Weight management
-    bmi = patient.get('bmi', 0)
-    if bmi >= 30:
+    if flags['is_obese']:
         recommendations.append({
             'category': 'Weight Management',
             'items': [
@@ -488,7 +546,7 @@ def display_recommendations():
                 "Consider bariatric consultation if BMI >40"
             ]
         })
-    elif bmi >= 25:
+    elif flags['is_overweight']:
         recommendations.append({
             'category': 'Weight Management',
             'items': [
@@ -497,7 +555,7 @@ def display_recommendations():
                 "Portion control and healthy eating habits"
             ]
         })
-    
+
     # General recommendations
     recommendations.append({
         'category': 'General Prevention',
@@ -510,27 +568,57 @@ def display_recommendations():
             "Stress management and adequate sleep"
         ]
     })
-    
-    # Display recommendations
-    for rec_group in recommendations:
-        st.markdown(f"### {rec_group['category']}")
-        for item in rec_group['items']:
-            st.markdown(f"""
-            <div class="recommendation-box">
-                🔹 {item}
-            </div>
-            """, unsafe_allow_html=True)
 
-def main():
-    """Main results page function."""
+    return "".join(
+        f"<h3>{rec_group['category']}</h3>" + "".join(
+            f'<div class="recommendation-box">🔹 {item}</div>'
+            for item in rec_group['items']
+        )
+        for rec_group in recommendations
+    )
+
+def display_recommendations(view: PatientView, results):
+    """Display personalized recommendations based on patient data."""
+
+    st.html('<h2>💡 Personalized Recommendations</h2>')
     
-    # Header
-    st.markdown('<h1 class="main-header">📈 Risk Assessment Results</h1>', unsafe_allow_html=True)
+    # Risk-based alert
+    risk_level = results.get('risk_level', 'Unknown')
+    probability = results.get('probability_percent', 0)
     
-    # DEBUG: Enhanced debug information
+    if 'Very High' in risk_level:
+        alert_class = "alert-danger"
+        alert_icon = "🚨"
+        alert_text = "Very High Risk - Immediate medical consultation recommended"
+    elif 'High' in risk_level:
+        alert_class = "alert-warning"
+        alert_icon = "⚠️"
+        alert_text = "High Risk - Comprehensive evaluation and prevention plan needed"
+    elif 'Moderate' in risk_level:
+        alert_class = "alert-warning"
+        alert_icon = "⚠️"
+        alert_text = "Moderate Risk - Preventive measures and lifestyle changes recommended"
+    else:
+        alert_class = "alert-success"
+        alert_icon = "✅"
+        alert_text = "Low Risk - Continue healthy lifestyle practices"
+    
+    st.html(f'<div class="{alert_class}">{alert_icon} {alert_text}</div>')
+    
+    # Specific recommendations, assembled as one cached HTML string so the
+    # page emits a single markdown delta instead of ~15 per rerun
+    st.html(build_recommendations_html(view))
+
+@st.fragment
+def _debug_panel():
+    """Debug information block.
+
+    Fragment-scoped so toggling the checkbox reruns only this block instead
+    of rebuilding both Plotly figures on the rest of the page.
+    """
     if st.checkbox("🔧 Show Debug Information"):
         st.subheader("Debug Info")
-        
+
         if st.session_state.prediction_results:
             st.write("**Prediction Results Found:**")
             results = st.session_state.prediction_results
@@ -538,18 +626,113 @@ def main():
             st.write(f"- Probability Percent: {results.get('probability_percent', 'Not found')}")
             st.write(f"- Risk Level: '{results.get('risk_level', 'Not found')}'")
             st.write(f"- Success: {results.get('success', 'Not found')}")
-            st.json(results)
         else:
             st.error("❌ No prediction results in session state!")
-        
-        if st.session_state.patient_data:
-            st.write("**Patient Data Found:**")
-            st.json(st.session_state.patient_data)
-        else:
+
+        if not st.session_state.patient_data:
             st.error("❌ No patient data in session state!")
-        
+
+        # st.json mounts a collapsible-tree widget on the frontend, which is
+        # the expensive part; only pay for it when explicitly requested
+        if st.checkbox("Show raw JSON"):
+            if st.session_state.prediction_results:
+                st.write("**Prediction Results:**")
+                st.json(st.session_state.prediction_results)
+            if st.session_state.patient_data:
+                st.write("**Patient Data:**")
+                st.json(st.session_state.patient_data)
+
         st.write("---")
-    
+
+@st.cache_data(show_spinner=False)
+def build_report_body(view: PatientView, results_tuple) -> str:
+    """Build the timestamp-free body of the downloadable report once.
+
+    Keyed on the hashable patient view and results tuple so reruns after the
+    download button renders don't re-format the report. The Generated:
+    header and filename stamp are deliberately NOT cached here: cache_data
+    is shared across sessions for the process lifetime, so a cached
+    timestamp would show the first generation's time on every later
+    download. The caller stamps each download at request time.
+    """
+    probability_percent, risk_level = results_tuple
+
+    return f"""
+PATIENT INFORMATION:
+- Age: {view.age} years
+- Gender: {view.gender}
+- BMI: {view.bmi}
+- Glucose Level: {view.avg_glucose_level} mg/dL
+- Hypertension: {'Yes' if view.hypertension else 'No'}
+- Heart Disease: {'Yes' if view.heart_disease else 'No'}
+
+RISK ASSESSMENT:
+- Stroke Probability: {probability_percent:.1f}%
+- Risk Level: {risk_level}
+
+IMPORTANT: This assessment is for educational purposes only.
+Consult healthcare providers for medical decisions.
+    """
+
+@st.fragment
+def _action_buttons():
+    """Bottom action-button row, fragment-scoped so clicking Download Report
+    doesn't rerun the full page."""
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🆕 New Assessment", use_container_width=True):
+            # Clear session state for new assessment
+            st.session_state.prediction_results = None
+            st.session_state.patient_data = None
+            st.switch_page("pages/risk_assessment.py")
+
+    with col2:
+        if st.button("📊 Modify Assessment", use_container_width=True):
+            st.switch_page("pages/risk_assessment.py")
+
+    with col3:
+        # Single download button (one click, cached bytes) instead of a
+        # button that reveals a second download button
+        if st.session_state.prediction_results and st.session_state.patient_data:
+            results = st.session_state.prediction_results
+
+            body = build_report_body(
+                PatientView.from_session(st.session_state.patient_data),
+                (
+                    results.get('probability_percent', 0),
+                    results.get('risk_level'),
+                ),
+            )
+
+            # Stamp per render, from one datetime.now() call so the filename
+            # and report header are provably the same instant; only the body
+            # above is cached
+            now = datetime.now()
+            stamp = now.strftime('%Y%m%d_%H%M%S')
+            report_bytes = (
+                "\nSTROKE RISK ASSESSMENT REPORT\n"
+                f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                + body
+            ).encode('utf-8')
+
+            st.download_button(
+                label="💾 Download Report",
+                data=report_bytes,
+                file_name=f"stroke_risk_report_{stamp}.txt",
+                mime="text/plain",
+                use_container_width=True
+            )
+
+def main():
+    """Main results page function."""
+
+    # Header
+    st.html('<h1 class="main-header">📈 Risk Assessment Results</h1>')
+
+    # DEBUG: Enhanced debug information (fragment-scoped)
+    _debug_panel()
+
     # Check if results exist
     if not st.session_state.prediction_results:
         st.error("❌ No prediction results found.")
@@ -573,89 +756,41 @@ def main():
         st.error("❌ Invalid prediction results - missing risk level data.")
         st.info("Please redo the risk assessment.")
         return
-    
+
+    if not patient:
+        st.error("❌ No patient data found. Please complete the risk assessment first.")
+        return
+
+    # Materialize the patient dict into an immutable view once, then hand it
+    # to the display functions; no further session-state dict lookups below
+    view = PatientView.from_session(patient)
+
+    # Evaluate all clinical thresholds once; display functions read the flags
+    st.session_state.risk_flags = compute_risk_flags(view)
+
     # Display patient summary
-    display_patient_summary()
-    
+    display_patient_summary(view)
+
     st.divider()
-    
+
     # Display risk analysis
-    display_risk_analysis()
-    
+    display_risk_analysis(results)
+
     st.divider()
-    
+
     # Display detailed risk factors
-    display_risk_factors()
-    
+    display_risk_factors(view, results)
+
     st.divider()
-    
+
     # Display recommendations
-    display_recommendations()
+    display_recommendations(view, results)
     
     st.divider()
     
-    # Action buttons
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🆕 New Assessment", use_container_width=True):
-            # Clear session state for new assessment
-            st.session_state.prediction_results = None
-            st.session_state.patient_data = None
-            st.switch_page("pages/risk_assessment.py")
-    
-    with col2:
-        if st.button("📊 Modify Assessment", use_container_width=True):
-            st.switch_page("pages/risk_assessment.py")
-    
-    with col3:
-        if st.button("💾 Download Report", use_container_width=True):
-            # Generate downloadable report
-            if st.session_state.prediction_results and st.session_state.patient_data:
-                results = st.session_state.prediction_results
-                patient = st.session_state.patient_data
-                
-                report_data = {
-                    'assessment_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'patient_age': patient.get('age'),
-                    'patient_gender': patient.get('gender', 'Unknown'),
-                    'stroke_probability': f"{results.get('probability_percent', 0):.1f}%",
-                    'risk_level': results.get('risk_level'),
-                    'bmi': patient.get('bmi'),
-                    'glucose_level': patient.get('avg_glucose_level'),
-                    'hypertension': 'Yes' if patient.get('hypertension') else 'No',
-                    'heart_disease': 'Yes' if patient.get('heart_disease') else 'No'
-                }
-                
-                # Convert to downloadable format
-                report_text = f"""
-STROKE RISK ASSESSMENT REPORT
-Generated: {report_data['assessment_date']}
-
-PATIENT INFORMATION:
-- Age: {report_data['patient_age']} years
-- Gender: {report_data['patient_gender']}
-- BMI: {report_data['bmi']}
-- Glucose Level: {report_data['glucose_level']} mg/dL
-- Hypertension: {report_data['hypertension']}
-- Heart Disease: {report_data['heart_disease']}
-
-RISK ASSESSMENT:
-- Stroke Probability: {report_data['stroke_probability']}
-- Risk Level: {report_data['risk_level']}
+    # Action buttons (fragment-scoped)
+    _action_buttons()
 
-IMPORTANT: This assessment is for educational purposes only.
-Consult healthcare providers for medical decisions.
-                """
-                
-                st.download_button(
-                    label="📄 Download Text Report",
-                    data=report_text,
-                    file_name=f"stroke_risk_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                    mime="text/plain",
-                    use_container_width=True
-                )
-    
     # Medical disclaimer
     st.markdown("""
     ---
@@ -0,0 +1,21 @@
+# Native st.navigation router
+# Replaces the sidebar st.button + st.switch_page pattern so a navigation
+# click swaps pages inside one hot script context instead of re-parsing
+# every pages/*.py script on each rerun.
+
+import streamlit as st
+
+
+def build_navigation(dashboard):
+    """Build the st.navigation object.
+
+    Args:
+        dashboard: Callable rendering the default landing/dashboard page.
+    """
+    pages = [
+        st.Page(dashboard, title="Home", icon="🏠", default=True),
+        st.Page("pages/risk_assessment.py", title="Risk Assessment", icon="📊"),
+        st.Page("pages/results.py", title="Results", icon="📈"),
+        st.Page("pages/about.py", title="About", icon="ℹ️"),
+    ]
+    return st.navigation(pages)
@@ -1,77 +1,105 @@
 from typing import Dict, List
 import streamlit as st
 
+# Recommendation lookup flattened into parallel tables (structure-of-arrays):
+# one hash lookup per field instead of a nested-dict traversal, and tuples so
+# the shared action lists are immutable and interned once at import.
+_TITLES = {
+    "Low Risk": "\U0001F7E2 Low Risk",
+    "Moderate Risk": "\U0001F7E1 Moderate Risk",
+    "High Risk": "\U0001F7E0 High Risk",
+    "Very High Risk": "\U0001F534 Very High Risk",
+}
+
+_COLORS = {
+    "Low Risk": "green",
+    "Moderate Risk": "orange",
+    "High Risk": "red",
+    "Very High Risk": "darkred",
+}
+
+_ACTIONS = {
+    "Low Risk": (
+        "Continue healthy lifestyle habits",
+        "Regular health checkups every 1-2 years",
+        "Maintain healthy weight and exercise regularly",
+        "Monitor blood pressure annually",
+    ),
+    "Moderate Risk": (
+        "Consult with primary care physician",
+        "Enhanced lifestyle modifications",
+        "Blood pressure monitoring every 6 months",
+        "Consider cardiovascular risk assessment",
+    ),
+    "High Risk": (
+        "Immediate consultation with healthcare provider",
+        "Comprehensive cardiovascular evaluation",
+        "Consider cardiology referral",
+        "Aggressive risk factor modification",
+    ),
+    "Very High Risk": (
+        "URGENT: Contact healthcare provider immediately",
+        "Emergency department evaluation if symptomatic",
+        "Immediate cardiology/neurology referral",
+        "Intensive medical management required",
+    ),
+}
+
+# Personalization messages indexed by rule bit; _score() below decides which
+# bits fire, so adding a rule means a new message here and a new branch there
+_MESSAGES = (
+    "🎯 Weight management: Target BMI < 25",
+    "🍎 Diabetes management: Target glucose < 140 mg/dL",
+    "🚭 Smoking cessation: Immediate priority",
+    "💊 Blood pressure control: Target < 130/80 mmHg",
+)
+
+def _score(bmi: float, glucose: float, smoking_code: int, htn: int) -> int:
+    """Bitmask of triggered personalization rules.
+
+    Pure scalar arithmetic on pre-encoded numeric inputs, deliberately shaped
+    so it could be JIT-compiled (e.g. numba @njit) without changes if the
+    rule set ever grows into the dozens.
+    """
+    mask = 0
+    if bmi > 30:
+        mask |= 1
+    if glucose > 140:
+        mask |= 2
+    if smoking_code == 1:
+        mask |= 4
+    if htn == 1:
+        mask |= 8
+    return mask
+
+@st.cache_resource
+def get_clinical_recommendations() -> "ClinicalRecommendations":
+    """Shared ClinicalRecommendations instance.
+
+    cache_resource keeps one instance per server process across reruns and
+    sessions instead of re-instantiating on every script execution.
+    """
+    return ClinicalRecommendations()
+
 class ClinicalRecommendations:
-    def __init__(self):
-        self.recommendations = {
-            "Low Risk": {
-                "title": "🟢 Low Risk",
-                "color": "green",
-                "actions": [
-                    "Continue healthy lifestyle habits",
-                    "Regular health checkups every 1-2 years",
-                    "Maintain healthy weight and exercise regularly",
-                    "Monitor blood pressure annually"
-                ]
-            },
-            "Moderate Risk": {
-                "title": "🟡 Moderate Risk",
-                "color": "orange",
-                "actions": [
-                    "Consult with primary care physician",
-                    "Enhanced lifestyle modifications",
-                    "Blood pressure monitoring every 6 months",
-                    "Consider cardiovascular risk assessment"
-                ]
-            },
-            "High Risk": {
-                "title": "🟠 High Risk",
-                "color": "red",
-                "actions": [
-                    "Immediate consultation with healthcare provider",
-                    "Comprehensive cardiovascular evaluation",
-                    "Consider cardiology referral",
-                    "Aggressive risk factor modification"
-                ]
-            },
-            "Very High Risk": {
-                "title": "🔴 Very High Risk",
-                "color": "darkred",
-                "actions": [
-                    "URGENT: Contact healthcare provider immediately",
-                    "Emergency department evaluation if symptomatic",
-                    "Immediate cardiology/neurology referral",
-                    "Intensive medical management required"
-                ]
-            }
-        }
-    
+    # The lookup tables live at module scope; instances carry no state
+
     def get_recommendations(self, risk_level: str, patient_data: Dict) -> Dict:
         """Generate personalized clinical recommendations"""
-        base_recommendations = self.recommendations[risk_level]
-        
-        # Add personalized recommendations based on modifiable risk factors
-        personalized = self._get_personalized_recommendations(patient_data)
-        
         return {
-            **base_recommendations,
-            "personalized": personalized
+            "title": _TITLES[risk_level],
+            "color": _COLORS[risk_level],
+            "actions": _ACTIONS[risk_level],
+            "personalized": self._get_personalized_recommendations(patient_data)
         }
-    
+
     def _get_personalized_recommendations(self, patient_data: Dict) -> List[str]:
         """Generate personalized recommendations based on patient profile"""
-        recommendations = []
-        
-        if patient_data.get('bmi', 0) > 30:
-            recommendations.append("🎯 Weight management: Target BMI < 25")
-        
-        if patient_data.get('avg_glucose_level', 0) > 140:
-            recommendations.append("🍎 Diabetes management: Target glucose < 140 mg/dL")
-        
-        if patient_data.get('smoking_status') == 'smokes':
-            recommendations.append("🚭 Smoking cessation: Immediate priority")
-        
-        if patient_data.get('hypertension') == 1:
-            recommendations.append("💊 Blood pressure control: Target < 130/80 mmHg")
-        
-        return recommendations
\ No newline at end of file
+        get = patient_data.get
+        mask = _score(
+            get('bmi', 0),
+            get('avg_glucose_level', 0),
+            1 if get('smoking_status') == 'smokes' else 0,
+            1 if get('hypertension') == 1 else 0,
+        )
+        return [msg for i, msg in enumerate(_MESSAGES) if mask & (1 << i)]
@@ -1,333 +1,465 @@
-# EXACT feature_engineering.py
-# Generated from feature_summary.csv with the exact 26 feature names
+# Unified feature engineering module
+# The exact feature order comes from feature_summary.csv; the legacy v1
+# order is kept as a selectable variant for backward compatibility
+
+import functools
+import logging
+import types
+from dataclasses import dataclass
+from enum import IntEnum
 
 import pandas as pd
 import numpy as np
 from typing import Dict, List
 
-class FixedFeatureEngineer:
-    """Feature Engineer with exact feature names from feature_summary.csv"""
-    
-    def __init__(self):
-        """Initialize with the EXACT 26 feature names from training."""
-        self.feature_names = [
-        'age_diabetes',
-        'cv_risk_count',
-        'age_decade',
-        'work_stress_level',
-        'hypertension_elderly',
-        'high_stress_work',
-        'hypertension',
-        'married',
-        'male_age_interaction',
-        'bmi_hypertension',
-        'age_hypertension_diabetes',
-        'bmi_glucose',
-        'heart_disease',
-        'bmi',
-        'age_high_risk',
-        'glucose_heart_disease',
-        'avg_glucose_level',
-        'gender_female',
-        'female_elderly',
-        'age_hypertension',
-        'age_obesity',
-        'age',
-        'gender_male',
-        'gender_Other',
-        'modifiable_risk_count',
-        'bmi_diabetes'
+# Hot-path diagnostics go through logging so production serving pays no
+# stdout formatting/flush cost unless DEBUG is explicitly enabled
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Recipe table: expression per feature name over the parsed scalars
+# (age, ht, hd, glu, bmi, gm, gf, go, mar) and the derived indicators
+# d (diabetic), e (elderly), o (obese). _compile_kernel turns a feature
+# order into a flat function with one store per output slot.
+_RECIPES = {
+    'age': 'age',
+    'hypertension': 'ht',
+    'heart_disease': 'hd',
+    'avg_glucose_level': 'glu',
+    'bmi': 'bmi',
+    'gender_male': 'gm',
+    'gender_Male': 'gm',
+    'gender_female': 'gf',
+    'gender_Other': 'go',
+    'married': 'mar',
+    'age_decade': 'age / 10.0',
+    'age_high_risk': 'e',
+    'cv_risk_count': 'ht + hd + d + o',
+    'modifiable_risk_count': 'ht + d + o',
+    'hypertension_elderly': 'ht * e',
+    'female_elderly': 'gf * e',
+    'male_age_interaction': 'gm * age',
+    'age_hypertension': 'age * ht',
+    'bmi_hypertension': 'bmi * ht',
+    'glucose_heart_disease': 'glu * hd',
+    'age_hypertension_diabetes': 'age * ht * d',
+    'bmi_glucose': 'bmi * glu',
+    'age_obesity': 'age * o',
+    'bmi_diabetes': 'bmi * d',
+    'age_diabetes': 'age * d',
+    'work_stress_level': '2.0',  # Default medium stress
+    'high_stress_work': '0.0',   # Default no high stress
+}
+
+# The exact training column order, frozen once at import. The pandas Index
+# is likewise built a single time so every DataFrame construction reuses it
+# instead of re-deriving an Index from a Python list per call.
+_EXPECTED_ORDER = (
+    'age_diabetes',
+    'cv_risk_count',
+    'age_decade',
+    'work_stress_level',
+    'hypertension_elderly',
+    'high_stress_work',
+    'hypertension',
+    'married',
+    'male_age_interaction',
+    'bmi_hypertension',
+    'age_hypertension_diabetes',
+    'bmi_glucose',
+    'heart_disease',
+    'bmi',
+    'age_high_risk',
+    'glucose_heart_disease',
+    'avg_glucose_level',
+    'gender_female',
+    'female_elderly',
+    'age_hypertension',
+    'age_obesity',
+    'age',
+    'gender_male',
+    'modifiable_risk_count',
+    'bmi_diabetes',
+    'gender_Male',
+    'gender_Other',
+)
+_EXPECTED_INDEX = pd.Index(_EXPECTED_ORDER)
+
+# Public variant constants: EXACT is the canonical training order above;
+# V1 is the legacy order from the old feature_engineering module (note its
+# historical duplicate gender_Male at positions 5 and 25, preserved so the
+# variant stays bit-for-bit compatible with what that module produced).
+FEATURE_NAMES_EXACT = _EXPECTED_ORDER
+FEATURE_NAMES_V1 = (
+    'age', 'hypertension', 'heart_disease', 'avg_glucose_level', 'bmi',
+    'gender_Male', 'gender_female', 'married',
+    'age_decade', 'age_high_risk', 'cv_risk_count',
+    'hypertension_elderly', 'female_elderly', 'male_age_interaction',
+    'age_hypertension', 'bmi_hypertension', 'glucose_heart_disease',
+    'age_hypertension_diabetes', 'bmi_glucose', 'age_obesity',
+    'bmi_diabetes', 'age_diabetes', 'modifiable_risk_count',
+    'work_stress_level', 'high_stress_work', 'gender_Male', 'gender_Other',
+)
+
+def _compile_kernel(feature_names):
+    """Generate a feature kernel specialized to one feature order.
+
+    The order is fixed at construction time, so instead of interpreting it
+    per call (dict lookups or a dispatch loop) we emit the source once —
+    one assignment per output slot, straight from _RECIPES — and exec it.
+    The resulting function has no loop, no dict and no name lookups at
+    call time; partial evaluation of the feature order into code.
+    """
+    lines = [
+        "def _kernel(age, ht, hd, glu, bmi, gm, gf, go, mar):",
+        "    d = float(glu > 125.0)",
+        "    e = float(age >= 65.0)",
+        "    o = float(bmi >= 30.0)",
+        "    out = np.empty(%d, dtype=np.float64)" % len(feature_names),
     ]
-        
-        print(f"✅ FixedFeatureEngineer initialized with {len(self.feature_names)} exact features")
+    lines.extend("    out[%d] = %s  # %s" % (i, _RECIPES[name], name)
+                 for i, name in enumerate(feature_names))
+    lines.append("    return out")
+
+    namespace = {'np': np}
+    exec("\n".join(lines), namespace)
+    return namespace['_kernel']
+
+# Kernel for the canonical training order, compiled once at import: server
+# startup pays the codegen exactly once, and every engineer instance binds
+# the same code object instead of re-exec'ing per construction.
+_EXACT_KERNEL = _compile_kernel(_EXPECTED_ORDER)
+
+class Gender(IntEnum):
+    """Gender parsed to an integer code once at ingress.
+
+    Downstream comparisons become single integer CMPs instead of repeated
+    Python string equality (hash + memcmp) on 'Male'/'Female' per call.
+    """
+    MALE = 0
+    FEMALE = 1
+    OTHER = 2
+
+_GENDER_CODES = {'Male': Gender.MALE, 'Female': Gender.FEMALE}
+
+@dataclass(slots=True)
+class PatientRecord:
+    """Typed patient input, parsed once at request ingress.
+
+    Downstream reads are C-level slot loads instead of re-hashing the same
+    dict keys on every engineering call; parse the incoming dict exactly
+    once with from_dict and pass the record along the hot path.
+    """
+    age: float = 50.0
+    hypertension: int = 0
+    heart_disease: int = 0
+    avg_glucose_level: float = 100.0
+    bmi: float = 25.0
+    gender: Gender = Gender.MALE
+    ever_married: str = 'Yes'
+    work_type: str = 'Private'
+    residence_type: str = 'Urban'
+    smoking_status: str = 'never_smoked'
+
+    @classmethod
+    def from_dict(cls, patient_data: Dict) -> 'PatientRecord':
+        get = patient_data.get
+        return cls(
+            age=float(get('age', 50)),
+            hypertension=int(get('hypertension', 0)),
+            heart_disease=int(get('heart_disease', 0)),
+            avg_glucose_level=float(get('avg_glucose_level', 100)),
+            bmi=float(get('bmi', 25)),
+            gender=_GENDER_CODES.get(get('gender', 'Male'), Gender.OTHER),
+            ever_married=get('ever_married', 'Yes'),
+            work_type=get('work_type', 'Private'),
+            residence_type=get('Residence_type', 'Urban'),
+            smoking_status=get('smoking_status', 'never_smoked'),
+        )
+
+class FixedFeatureEngineer:
+    """Feature Engineer parameterized on the feature order.
+
+    Defaults to FEATURE_NAMES_EXACT, the order the calibrated model was
+    trained on; pass FEATURE_NAMES_V1 (or any order covered by _RECIPES)
+    for the legacy variant. One class, one kernel machinery — the former
+    feature_engineering module re-exports this one.
+    """
+
+    # Slot storage: no per-instance __dict__, and attribute reads go through
+    # C-level slot descriptors — matters for workers/tests that build many
+    __slots__ = ('feature_names', '_kernel', '_engineer_cached', '_index')
+
+    def __init__(self, feature_names=None):
+        """Initialize with a feature order (defaults to the exact order).
+
+        The exact order is the CSV order from feature_summary.csv plus the
+        trailing gender_Male / gender_Other columns the model also expects
+        — the same order the generated kernel writes and
+        create_feature_dataframe emits.
+        """
+        order = _EXPECTED_ORDER if feature_names is None else tuple(feature_names)
+        self.feature_names = list(order)
+
+        # The canonical-order kernel (and its Index) are precompiled at
+        # import; construction just binds them, so the default variant
+        # never pays codegen or Index-building cost
+        if order == _EXPECTED_ORDER:
+            self._kernel = _EXACT_KERNEL
+            self._index = _EXPECTED_INDEX
+        else:
+            self._kernel = _compile_kernel(order)
+            self._index = pd.Index(order)
+
+        # Memoized kernel: identical parsed inputs (UI reruns, demo and
+        # test flows resubmitting the same patient) short-circuit to one
+        # hash lookup. Results are stored as tuples so cache hits hand out
+        # immutable values.
+        self._engineer_cached = functools.lru_cache(maxsize=1024)(
+            lambda *scalars: tuple(self._kernel(*scalars)))
+
+        logger.debug("FixedFeatureEngineer initialized with %d exact features", len(self.feature_names))
     
-    def engineer_features(self, patient_data: Dict) -> List[float]:
-        """Create features matching the exact training order."""
-        
-        # Extract basic patient data
+    def _parse(self, patient_data: Dict):
+        """Extract the nine scalars the kernel consumes from a patient dict."""
         age = float(patient_data.get('age', 50))
         hypertension = int(patient_data.get('hypertension', 0))
         heart_disease = int(patient_data.get('heart_disease', 0))
         avg_glucose_level = float(patient_data.get('avg_glucose_level', 100))
         bmi = float(patient_data.get('bmi', 25))
-        
-        # Handle gender
+
         gender = patient_data.get('gender', 'Male')
-        gender_male = 1 if gender == 'Male' else 0
-        gender_female = 1 if gender == 'Female' else 0
-        
-        # Handle marriage
-        ever_married = patient_data.get('ever_married', 'Yes')
-        married = 1 if ever_married == 'Yes' else 0
-        
-        # Handle work type
-        work_type = patient_data.get('work_type', 'Private')
-        
-        # Handle residence type
-        residence_type = patient_data.get('Residence_type', 'Urban')
-        
-        # Handle smoking status
-        smoking_status = patient_data.get('smoking_status', 'never_smoked')
-        
-        # Calculate derived indicators
-        diabetes_indicator = 1 if avg_glucose_level > 125 else 0
-        elderly_indicator = 1 if age >= 65 else 0
-        obesity_indicator = 1 if bmi >= 30 else 0
-        
-        # Create comprehensive feature mapping for ALL possible features
-        feature_mapping = {
-            # Basic demographic features
-            'age': age,
-            'hypertension': hypertension,
-            'heart_disease': heart_disease,
-            'avg_glucose_level': avg_glucose_level,
-            'bmi': bmi,
-            
-            # Gender features
-            'gender_male': 1 if gender == 'Male' else 0,
-            'gender_female': 1 if gender == 'Female' else 0,
-            'gender_Male': 1 if gender == 'Male' else 0,  # For backward compatibility
-            'gender_Female': 1 if gender == 'Female' else 0,  # For backward compatibility
-            'gender_Other': 1 if gender not in ['Male', 'Female'] else 0,
-            
-            # Marriage features
-            'married': married,
-            'ever_married_Yes': float(married),
-            'ever_married_No': float(1 - married),
-            
-            # Work type features
-            'work_type_Private': 1.0 if work_type == 'Private' else 0.0,
-            'work_type_Self-employed': 1.0 if work_type == 'Self-employed' else 0.0,
-            'work_type_Govt_job': 1.0 if work_type == 'Govt_job' else 0.0,
-            'work_type_children': 1.0 if work_type == 'children' else 0.0,
-            'work_type_Never_worked': 1.0 if work_type == 'Never_worked' else 0.0,
-            
-            # Residence type features
-            'Residence_type_Urban': 1.0 if residence_type == 'Urban' else 0.0,
-            'Residence_type_Rural': 1.0 if residence_type == 'Rural' else 0.0,
-            
-            # Smoking status features
-            'smoking_status_never smoked': 1.0 if 'never' in smoking_status else 0.0,
-            'smoking_status_formerly smoked': 1.0 if 'formerly' in smoking_status else 0.0,
-            'smoking_status_smokes': 1.0 if smoking_status == 'smokes' else 0.0,
-            'smoking_status_Unknown': 1.0 if smoking_status == 'Unknown' else 0.0,
-            
-            # Age-based engineered features
-            'age_decade': age / 10.0,
-            'age_high_risk': float(elderly_indicator),
-            'age_squared': age * age,
-            
-            # Risk count features
-            'cv_risk_count': float(hypertension + heart_disease + diabetes_indicator + obesity_indicator),
-            'modifiable_risk_count': float(hypertension + diabetes_indicator + obesity_indicator),
-            
-            # Interaction features
-            'hypertension_elderly': float(hypertension * elderly_indicator),
-            'female_elderly': float(gender_female * elderly_indicator),
-            'male_elderly': float(gender_male * elderly_indicator),
-            'male_age_interaction': float(gender_male * age),
-            'female_age_interaction': float(gender_female * age),
-            'age_hypertension': float(age * hypertension),
-            'age_heart_disease': float(age * heart_disease),
-            'bmi_hypertension': float(bmi * hypertension),
-            'bmi_heart_disease': float(bmi * heart_disease),
-            'glucose_heart_disease': float(avg_glucose_level * heart_disease),
-            'glucose_hypertension': float(avg_glucose_level * hypertension),
-            'age_hypertension_diabetes': float(age * hypertension * diabetes_indicator),
-            'bmi_glucose': float(bmi * avg_glucose_level),
-            'age_obesity': float(age * obesity_indicator),
-            'bmi_diabetes': float(bmi * diabetes_indicator),
-            'age_diabetes': float(age * diabetes_indicator),
-            
-            # BMI categories
-            'bmi_normal': 1.0 if 18.5 <= bmi < 25 else 0.0,
-            'bmi_overweight': 1.0 if 25 <= bmi < 30 else 0.0,
-            'bmi_obese': 1.0 if bmi >= 30 else 0.0,
-            'bmi_underweight': 1.0 if bmi < 18.5 else 0.0,
-            
-            # Glucose categories
-            'glucose_normal': 1.0 if avg_glucose_level < 100 else 0.0,
-            'glucose_prediabetic': 1.0 if 100 <= avg_glucose_level <= 125 else 0.0,
-            'glucose_diabetic': 1.0 if avg_glucose_level > 125 else 0.0,
-            
-            # Age categories
-            'age_young': 1.0 if age < 45 else 0.0,
-            'age_middle': 1.0 if 45 <= age < 65 else 0.0,
-            'age_elderly': 1.0 if age >= 65 else 0.0,
-            
-            # Work-related features
-            'work_stress_level': 2.0,  # Default medium stress
-            'high_stress_work': 0.0,   # Default no high stress
-            
-            # Complex interactions
-            'age_bmi_interaction': age * bmi,
-            'glucose_age_interaction': avg_glucose_level * age,
-            'hypertension_heart_disease': float(hypertension * heart_disease),
-            
-            # Risk scores
-            'cardiovascular_risk_score': float(age/10 + hypertension*2 + heart_disease*3 + diabetes_indicator*2),
-            'metabolic_risk_score': float(bmi/5 + avg_glucose_level/50 + diabetes_indicator*3),
-        }
-        
-        # Create feature vector in EXACT order from CSV
-        features = []
-        for feature_name in self.feature_names:
-            if feature_name in feature_mapping:
-                features.append(float(feature_mapping[feature_name]))
-            else:
-                # Unknown feature - set to 0 and warn
-                print(f"⚠️ Unknown feature '{feature_name}' set to 0.0")
-                features.append(0.0)
-        
-        print(f"🔧 Created {len(features)} features in exact CSV order")
-        return features
-    
+        gender_male = int(gender == 'Male')
+        gender_female = int(gender == 'Female')
+        gender_other = 1 - gender_male - gender_female
+
+        married = int(patient_data.get('ever_married', 'Yes') == 'Yes')
+
+        return (age, hypertension, heart_disease, avg_glucose_level, bmi,
+                gender_male, gender_female, gender_other, married)
+
+    def engineer_features(self, patient_data: Dict) -> List[float]:
+        """Create features matching the exact training order."""
+
+        # Only dict parsing happens at interpreted level; the arithmetic
+        # runs in the generated kernel, memoized on the parsed scalars
+        features = self._engineer_cached(*self._parse(patient_data))
+
+        logger.debug("Created %d features in exact CSV order", len(features))
+        return list(features)
+
+    def _engineer_features_fast(self, patient_data: Dict) -> np.ndarray:
+        """Engineer features assuming already-validated, typed inputs.
+
+        Skips the defensive float()/int() coercions _parse applies to every
+        field. Only for callers behind the validation layer (the form flow
+        runs InputValidator first, which guarantees numeric types);
+        engineer_features remains the safe entry point.
+        """
+        get = patient_data.get
+        gender = get('gender', 'Male')
+        gender_male = int(gender == 'Male')
+        gender_female = int(gender == 'Female')
+        return self._kernel(
+            get('age', 50), get('hypertension', 0), get('heart_disease', 0),
+            get('avg_glucose_level', 100), get('bmi', 25),
+            gender_male, gender_female, 1 - gender_male - gender_female,
+            int(get('ever_married', 'Yes') == 'Yes'))
+
+    def engineer_features_record(self, record: PatientRecord) -> np.ndarray:
+        """Engineer features from an already-parsed PatientRecord.
+
+        Bypasses the dict-parsing step of engineer_features; every input
+        read is a slot load on the record and the gender checks are
+        integer compares on the pre-parsed Gender code, so callers that
+        parse once at ingress pay no per-call key hashing or string
+        comparisons.
+        """
+        gender_male = int(record.gender == Gender.MALE)
+        gender_female = int(record.gender == Gender.FEMALE)
+        return self._kernel(
+            record.age, record.hypertension, record.heart_disease,
+            record.avg_glucose_level, record.bmi,
+            gender_male, gender_female, 1 - gender_male - gender_female,
+            int(record.ever_married == 'Yes'))
+
+    def engineer_features_batch(self, patients: List[Dict]) -> np.ndarray:
+        """Engineer features for N patients in one vectorized pass.
+
+        Stacks the raw inputs into typed columnar arrays and computes every
+        derived feature with whole-column NumPy ops instead of looping
+        engineer_features per patient, returning a C-contiguous (N, 27)
+        float32 matrix ready for a single predict_proba call.
+        """
+        # float32 from the first store: half the bytes through the cache
+        # hierarchy and twice the SIMD lanes for every derived column, with
+        # no trailing float64→float32 conversion pass
+        n = len(patients)
+        age = np.fromiter((float(p.get('age', 50)) for p in patients),
+                          dtype=np.float32, count=n)
+        ht = np.fromiter((float(p.get('hypertension', 0)) for p in patients),
+                         dtype=np.float32, count=n)
+        hd = np.fromiter((float(p.get('heart_disease', 0)) for p in patients),
+                         dtype=np.float32, count=n)
+        glu = np.fromiter((float(p.get('avg_glucose_level', 100)) for p in patients),
+                          dtype=np.float32, count=n)
+        bmi = np.fromiter((float(p.get('bmi', 25)) for p in patients),
+                          dtype=np.float32, count=n)
+        gm = np.fromiter((1.0 if p.get('gender', 'Male') == 'Male' else 0.0
+                          for p in patients), dtype=np.float32, count=n)
+        gf = np.fromiter((1.0 if p.get('gender', 'Male') == 'Female' else 0.0
+                          for p in patients), dtype=np.float32, count=n)
+        go = np.float32(1.0) - gm - gf
+        married = np.fromiter((1.0 if p.get('ever_married', 'Yes') == 'Yes' else 0.0
+                               for p in patients), dtype=np.float32, count=n)
+
+        diabetes = (glu > 125).astype(np.float32)
+        elderly = (age >= 65).astype(np.float32)
+        obese = (bmi >= 30).astype(np.float32)
+
+        # Columns in the same order as _RECIPES emits / feature_names
+        mat = np.column_stack((
+            age * diabetes,                 # age_diabetes
+            ht + hd + diabetes + obese,     # cv_risk_count
+            age / 10.0,                     # age_decade
+            np.full(n, 2.0, dtype=np.float32),   # work_stress_level (default)
+            ht * elderly,                   # hypertension_elderly
+            np.zeros(n, dtype=np.float32),  # high_stress_work (default)
+            ht,                             # hypertension
+            married,                        # married
+            gm * age,                       # male_age_interaction
+            bmi * ht,                       # bmi_hypertension
+            age * ht * diabetes,            # age_hypertension_diabetes
+            bmi * glu,                      # bmi_glucose
+            hd,                             # heart_disease
+            bmi,                            # bmi
+            elderly,                        # age_high_risk
+            glu * hd,                       # glucose_heart_disease
+            glu,                            # avg_glucose_level
+            gf,                             # gender_female
+            gf * elderly,                   # female_elderly
+            age * ht,                       # age_hypertension
+            age * obese,                    # age_obesity
+            age,                            # age
+            gm,                             # gender_male
+            ht + diabetes + obese,          # modifiable_risk_count
+            bmi * diabetes,                 # bmi_diabetes
+            gm,                             # gender_Male
+            go,                             # gender_Other
+        ))
+        return np.ascontiguousarray(mat, dtype=np.float32)
+
+    def create_feature_array(self, patient_data: Dict) -> np.ndarray:
+        """Engineer features as a (1, 27) float32 array, skipping pandas.
+
+        A one-row DataFrame costs a BlockManager construction that dwarfs
+        the feature arithmetic itself. Callers holding an estimator that
+        accepts plain ndarrays (e.g. model_handler.predict_from_array)
+        should prefer this path; create_feature_dataframe stays for the
+        pipeline whose StandardScaler was fitted with named columns.
+        """
+        return self._kernel(*self._parse(patient_data)).astype(
+            np.float32).reshape(1, -1)
+
+    def engineer_features_sparse(self, patient_data: Dict):
+        """Engineer features as a 1×27 CSR row holding only non-zeros.
+
+        Several columns are constant zero and most interaction terms
+        collapse to zero for healthy patients (hypertension=0 wipes five
+        columns at once), so a sparse row lets a downstream estimator that
+        accepts scipy sparse input skip the multiply-by-zero work. The
+        calibrated pipeline here was fitted on dense named columns, so
+        this is opt-in for array-path callers, not the default.
+        """
+        from scipy import sparse  # deferred: only sparse callers pay the import
+
+        return sparse.csr_matrix(
+            self._kernel(*self._parse(patient_data)).reshape(1, -1))
+
     def create_feature_dataframe(self, patient_data: Dict) -> pd.DataFrame:
         """Create features as DataFrame with exact feature names from CSV."""
-        # Instead of using the feature_names list which might be in the wrong order,
-        # we'll create a dictionary of all possible features and then select only what we need
-        # in the exact order the model expects
-        
-        # Get all possible features
-        all_features = self.get_all_features(patient_data)
-        
-        # Define the exact feature order expected by the model
-        # This is the critical part - these must match exactly what the model was trained with
-        # We're combining features from feature_summary.csv and additional features the model expects
-        expected_feature_order = [
-            'age_diabetes',
-            'cv_risk_count',
-            'age_decade',
-            'work_stress_level',
-            'hypertension_elderly',
-            'high_stress_work',
-            'hypertension',
-            'married',
-            'male_age_interaction',
-            'bmi_hypertension',
-            'age_hypertension_diabetes',
-            'bmi_glucose',
-            'heart_disease',
-            'bmi',
-            'age_high_risk',
-            'glucose_heart_disease',
-            'avg_glucose_level',
-            'gender_female',
-            'female_elderly',
-            'age_hypertension',
-            'age_obesity',
-            'age',
-            'gender_male',
-            'modifiable_risk_count',
-            'bmi_diabetes',
-            # Additional features required by the model but not in CSV
-            'gender_Male',
-            'gender_Other'
-        ]
-        
-        print(f"✅ Using {len(expected_feature_order)} features including gender_Male and gender_Other")
-        
-        # Create a new DataFrame with features in the exact expected order
-        ordered_features = []
-        for feature_name in expected_feature_order:
-            if feature_name in all_features:
-                ordered_features.append(all_features[feature_name])
-            else:
-                print(f"⚠️ Missing expected feature: {feature_name}, setting to 0")
-                ordered_features.append(0.0)
-        
-        # Create DataFrame with the exact feature order
-        df = pd.DataFrame([ordered_features], columns=expected_feature_order)
-        
-        # Debug information
-        print(f"🔍 DataFrame columns: {df.columns.tolist()}")
-        print(f"🔍 gender_Male present: {'gender_Male' in df.columns}")
-        print(f"🔍 Number of features: {len(df.columns)}")
-        
+        # feature_names is frozen at __init__ and the generated kernel
+        # writes its slots in that same fixed order — so there is no
+        # per-call feature dict to build and no name-by-name lookup loop;
+        # the vector goes straight into the DataFrame
+        features = self._kernel(*self._parse(patient_data))
+
+        df = pd.DataFrame([features], columns=self._index)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DataFrame columns: %s", df.columns.tolist())
+            logger.debug("gender_Male present: %s", 'gender_Male' in df.columns)
+            logger.debug("Number of features: %d", len(df.columns))
+
         return df
-        
+
     def get_all_features(self, patient_data: Dict) -> Dict:
-        """Get all possible features as a dictionary."""
-        # Extract basic patient data
-        age = float(patient_data.get('age', 65))
-        gender = patient_data.get('gender', 'Male')
-        hypertension = int(patient_data.get('hypertension', 0))
-        heart_disease = int(patient_data.get('heart_disease', 0))
-        ever_married = patient_data.get('ever_married', 'Yes')
-        work_type = patient_data.get('work_type', 'Private')
-        residence_type = patient_data.get('residence_type', 'Urban')
-        avg_glucose_level = float(patient_data.get('avg_glucose_level', 100))
-        bmi = float(patient_data.get('bmi', 25))
-        smoking_status = patient_data.get('smoking_status', 'never_smoked')
-        
-        # Derived indicators
-        diabetes_indicator = 1 if avg_glucose_level > 125 else 0
-        elderly_indicator = 1 if age >= 65 else 0
-        obesity_indicator = 1 if bmi >= 30 else 0
-        
-        # Gender features - ensure correct case for gender_Male
-        gender_male = 1 if gender == 'Male' else 0
-        gender_female = 1 if gender == 'Female' else 0
-        gender_Male = 1 if gender == 'Male' else 0  # Exact case match
-        gender_Other = 1 if gender not in ['Male', 'Female'] else 0
-        
-        # Marriage features
-        married = 1 if ever_married == 'Yes' else 0
-        
-        # Create a comprehensive dictionary of all possible features
-        all_features = {
-            # Basic features
-            'age': age,
-            'hypertension': hypertension,
-            'heart_disease': heart_disease,
-            'avg_glucose_level': avg_glucose_level,
-            'bmi': bmi,
-            'gender_male': gender_male,
-            'gender_Male': gender_Male,  # Ensure exact case match
-            'gender_female': gender_female,
-            'gender_Other': gender_Other,
-            'married': married,
-            
-            # Age-based features
-            'age_decade': age / 10.0,
-            'age_high_risk': float(elderly_indicator),
-            
-            # Risk count features
-            'cv_risk_count': float(hypertension + heart_disease + diabetes_indicator + obesity_indicator),
-            'modifiable_risk_count': float(hypertension + diabetes_indicator + obesity_indicator),
-            
-            # Interaction features
-            'hypertension_elderly': float(hypertension * elderly_indicator),
-            'female_elderly': float(gender_female * elderly_indicator),
-            'male_age_interaction': float(gender_male * age),
-            'age_hypertension': float(age * hypertension),
-            'bmi_hypertension': float(bmi * hypertension),
-            'glucose_heart_disease': float(avg_glucose_level * heart_disease),
-            'age_hypertension_diabetes': float(age * hypertension * diabetes_indicator),
-            'bmi_glucose': float(bmi * avg_glucose_level),
-            'age_obesity': float(age * obesity_indicator),
-            'bmi_diabetes': float(bmi * diabetes_indicator),
-            'age_diabetes': float(age * diabetes_indicator),
-            
-            # Work-related features
-            'work_stress_level': 2.0,  # Default medium stress
-            'high_stress_work': 0.0    # Default no high stress
-        }
-        
-        return all_features
+        """Get the engineered features as a name → value dictionary.
+
+        Shares the single parse + kernel pass with engineer_features and
+        create_feature_dataframe rather than recomputing every value with
+        its own copy of the arithmetic, so calling any combination of the
+        three APIs costs one arithmetic pass each, never two.
+        """
+        return dict(zip(self.feature_names,
+                        self._kernel(*self._parse(patient_data))))
     
+    # Built once at class creation and shared read-only across instances
+    _DESCRIPTIONS = types.MappingProxyType({
+        'age': 'Patient age in years',
+        'hypertension': 'Has hypertension (1=yes, 0=no)',
+        'heart_disease': 'Has heart disease (1=yes, 0=no)',
+        'avg_glucose_level': 'Average glucose level (mg/dL)',
+        'bmi': 'Body Mass Index',
+        'gender_male': 'Is male (1=yes, 0=no)',
+        'gender_female': 'Is female (1=yes, 0=no)',
+        'married': 'Is married (1=yes, 0=no)',
+        'age_decade': 'Age divided by 10',
+        'age_high_risk': 'Is elderly (age >= 65)',
+        'cv_risk_count': 'Count of cardiovascular risk factors',
+        'hypertension_elderly': 'Has hypertension AND is elderly',
+        'female_elderly': 'Is female AND elderly',
+        'male_age_interaction': 'Male gender × age interaction',
+        'age_hypertension': 'Age × hypertension interaction',
+        'bmi_hypertension': 'BMI × hypertension interaction',
+        'glucose_heart_disease': 'Glucose × heart disease interaction',
+        'age_hypertension_diabetes': 'Age × hypertension × diabetes interaction',
+        'bmi_glucose': 'BMI × glucose interaction',
+        'age_obesity': 'Age × obesity interaction',
+        'bmi_diabetes': 'BMI × diabetes interaction',
+        'age_diabetes': 'Age × diabetes interaction',
+        'modifiable_risk_count': 'Count of modifiable risk factors',
+        'work_stress_level': 'Work stress level (default: 2)',
+        'high_stress_work': 'Has high stress work (default: 0)',
+        'gender_Male': 'Is male (1=yes, 0=no)',
+        'gender_Other': 'Is other gender (1=yes, 0=no, default: 0)'
+    })
+
+    def get_feature_descriptions(self) -> Dict[str, str]:
+        """Get human-readable descriptions of all features."""
+        return self._DESCRIPTIONS
+
     def validate_features(self, features: List[float]) -> bool:
-        """Validate feature count and values."""
-        if len(features) != len(self.feature_names):
-            print(f"❌ Feature count mismatch: {len(features)} vs {len(self.feature_names)}")
+        """Validate feature count and values in one vectorized pass.
+
+        A single np.isfinite over the whole vector replaces the per-element
+        Python loop with its scalar ufunc dispatch per feature.
+        """
+        try:
+            arr = np.asarray(features, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            logger.debug("Features not numeric: %s", e)
             return False
-        
-        for i, f in enumerate(features):
-            if not isinstance(f, (int, float, bool)) or np.isnan(f) or np.isinf(f):
-                print(f"❌ Invalid feature {i} ({self.feature_names[i]}): {f}")
-                return False
-        
-        print(f"✅ All {len(features)} features valid")
+
+        if arr.shape != (len(self.feature_names),):
+            logger.debug("Feature count mismatch: %d vs %d", arr.size, len(self.feature_names))
+            return False
+
+        if not np.isfinite(arr).all():
+            logger.debug("Features contain NaN or inf values")
+            return False
+
+        logger.debug("All %d features valid", arr.size)
         return True
 
 # Backward compatibility
@@ -1,6 +1,18 @@
+import numpy as np
 import streamlit as st
 from typing import Dict, List, Tuple
 
+# Allowed values for the categorical fields, with the error text prebuilt.
+# Moved here from ModelHandler.validate_prediction_inputs so one validator
+# owns every rule; fields are only checked when present, mirroring the
+# range-check skip semantics.
+_CATEGORICAL_RULES = (
+    ('gender', ('Male', 'Female'), "Gender must be 'Male' or 'Female'"),
+    ('ever_married', ('Yes', 'No'), "Ever married must be 'Yes' or 'No'"),
+    ('hypertension', (0, 1), "Hypertension must be 0 or 1"),
+    ('heart_disease', (0, 1), "Heart disease must be 0 or 1"),
+)
+
 class InputValidator:
     def __init__(self):
         self.validation_rules = {
@@ -8,33 +20,64 @@ class InputValidator:
             'bmi': (10.0, 70.0),
             'avg_glucose_level': (50.0, 400.0)
         }
-    
+        # Bounds as parallel arrays, built once: the per-submit range sweep
+        # becomes a single vectorized compare instead of an interpreted loop
+        # over the rules dict with two branches per field
+        self._fields = tuple(self.validation_rules)
+        self._lo = np.array([lo for lo, _ in self.validation_rules.values()], dtype=np.float64)
+        self._hi = np.array([hi for _, hi in self.validation_rules.values()], dtype=np.float64)
+
     def validate_patient_data(self, data: Dict) -> Tuple[bool, List[str]]:
         """Validate all patient input data"""
         errors = []
-        
-        # Range validations
-        for field, (min_val, max_val) in self.validation_rules.items():
-            if field in data:
-                if not (min_val <= data[field] <= max_val):
-                    errors.append(f"{field} must be between {min_val} and {max_val}")
-        
+
+        # Range validations: one vectorized compare over all bounded fields.
+        # Missing fields fall back to their lower bound so they pass the
+        # range check (same skip behavior as the old `field in data` loop).
+        vals = np.fromiter(
+            (data.get(field, lo) for field, lo in zip(self._fields, self._lo)),
+            dtype=np.float64, count=len(self._fields))
+        # Negated in-range form rather than (vals < lo) | (vals > hi): NaN
+        # compares False either way, so only this form flags NaN inputs as
+        # out of range like the original chained comparison did
+        mask = ~((vals >= self._lo) & (vals <= self._hi))
+        if mask.any():
+            for i in np.flatnonzero(mask):
+                field = self._fields[i]
+                min_val, max_val = self.validation_rules[field]
+                errors.append(f"{field} must be between {min_val} and {max_val}")
+
+        # Categorical validations
+        for field, allowed, message in _CATEGORICAL_RULES:
+            if field in data and data[field] not in allowed:
+                errors.append(message)
+
         # Clinical reasonableness checks
         if data.get('age', 0) < 18:
             errors.append("Age must be 18 or older")
-        
+
         if data.get('bmi', 0) < 12 and data.get('age', 0) > 18:
             errors.append("BMI seems unrealistically low for an adult")
-        
+
         # Glucose level warnings
         if data.get('avg_glucose_level', 0) > 300:
             st.warning("⚠️ Extremely high glucose level detected. Please verify this value.")
-        
+
         return len(errors) == 0, errors
-    
+
     def display_validation_errors(self, errors: List[str]):
         """Display validation errors in Streamlit"""
         if errors:
             st.error("Please correct the following issues:")
             for error in errors:
-                st.error(f"• {error}")
\ No newline at end of file
+                st.error(f"• {error}")
+
+@st.cache_resource
+def get_validator() -> InputValidator:
+    """One InputValidator per server process.
+
+    Streamlit reruns the page script on every widget interaction; caching
+    here means the rules dict and bound arrays are built once instead of
+    per rerun, and every page shares the same instance.
+    """
+    return InputValidator()
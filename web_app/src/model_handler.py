@@ -1,24 +1,226 @@
+import logging
+import sys
+from datetime import datetime
+
 import joblib
 import numpy as np
-import pandas as pd
 import streamlit as st
 import warnings
 from typing import Dict, Tuple, List
 
-# Suppress StandardScaler feature name warnings
+# Hot-path diagnostics go through logging (disabled by default) rather than
+# print(): no stdout flush per prediction, and the lazy %-formatting plus the
+# isEnabledFor guards skip the message/reduction work entirely when off
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Canonical risk labels, interned once: every consumer dict lookup then
+# hashes the same string object (cached hash, identity-equal), instead of
+# re-hashing a fresh label per prediction
+LOW_RISK, MODERATE_RISK, HIGH_RISK, VERY_HIGH_RISK = map(
+    sys.intern, ("Low Risk", "Moderate Risk", "High Risk", "Very High Risk"))
+
+# Exact column order the trained pipeline expects (mirrors the feature
+# engineer's expected_feature_order); callers that already hold a numeric
+# feature vector can predict without re-running the dict-based engineering
+FEATURE_ORDER = (
+    'age_diabetes',
+    'cv_risk_count',
+    'age_decade',
+    'work_stress_level',
+    'hypertension_elderly',
+    'high_stress_work',
+    'hypertension',
+    'married',
+    'male_age_interaction',
+    'bmi_hypertension',
+    'age_hypertension_diabetes',
+    'bmi_glucose',
+    'heart_disease',
+    'bmi',
+    'age_high_risk',
+    'glucose_heart_disease',
+    'avg_glucose_level',
+    'gender_female',
+    'female_elderly',
+    'age_hypertension',
+    'age_obesity',
+    'age',
+    'gender_male',
+    'modifiable_risk_count',
+    'bmi_diabetes',
+    'gender_Male',
+    'gender_Other',
+)
+
+# Smoking status as a small int code (0 never/unknown, 1 former, 2 current):
+# the patient form attaches the code once under '_smoke_code' so downstream
+# checks are integer compares; the table covers both the form's snake_case
+# values and the training CSV's spaced spellings for callers passing raw
+# dicts, where one hash probe replaces the old substring scans
+_SMOKING_CODES = {
+    'smokes': 2, 'currently_smokes': 2, 'currently smokes': 2,
+    'formerly_smoked': 1, 'formerly smoked': 1,
+}
+
+def _smoking_code(patient_data) -> int:
+    """Smoking code for a dict or record, preferring the form's precomputed one."""
+    if isinstance(patient_data, PatientRecord):
+        return _SMOKING_CODES.get(patient_data.smoking_status, 0)
+    code = patient_data.get('_smoke_code')
+    if code is None:
+        code = _SMOKING_CODES.get(
+            patient_data.get('smoking_status', 'never_smoked'), 0)
+    return code
+
+# Suppress StandardScaler feature name warnings (belt-and-braces: the fitted
+# feature-name metadata is also stripped at load, see _strip_feature_names)
 warnings.filterwarnings('ignore', message='.*feature names.*')
 warnings.filterwarnings('ignore', message='.*StandardScaler.*')
 
-# Import the fixed feature engineer
-from src.feature_engineering_exact import FixedFeatureEngineer
+def _strip_feature_names(est):
+    """Recursively clear fitted feature-name metadata from an estimator.
+
+    With no feature_names_in_ recorded, raw ndarrays are first-class inputs
+    — sklearn neither warns nor runs its per-call column-name comparison —
+    which is the structural fix the warning filters above only paper over.
+    Walks pipeline steps and calibrated sub-estimators.
+    """
+    if est is None:
+        return
+    if hasattr(est, 'feature_names_in_'):
+        try:
+            del est.feature_names_in_
+        except AttributeError:
+            pass
+    for step in getattr(est, 'named_steps', {}).values():
+        _strip_feature_names(step)
+    _strip_feature_names(getattr(est, 'estimator', None))
+    for calibrated in getattr(est, 'calibrated_classifiers_', ()):
+        _strip_feature_names(getattr(calibrated, 'estimator', None))
+
+# Import the fixed feature engineer, the typed patient record and the
+# consolidated validator
+from src.feature_engineering_exact import FixedFeatureEngineer, Gender, PatientRecord
+from src.input_validation import get_validator
+
+# Fields a prediction cannot proceed without; checked with one set
+# difference instead of a per-field membership loop
+_REQUIRED_FIELDS = frozenset((
+    'age', 'gender', 'hypertension', 'heart_disease',
+    'ever_married', 'work_type', 'Residence_type',
+    'avg_glucose_level', 'bmi', 'smoking_status',
+))
+
+def _as_record(patient_data) -> PatientRecord:
+    """Parse a raw patient dict into a PatientRecord (pass-through if the
+    caller already holds one).
+
+    The summary/importance helpers each probed the same dict keys 8-10
+    times per prediction; parsing once turns those into slot attribute
+    loads with the defaults resolved up front.
+    """
+    if isinstance(patient_data, PatientRecord):
+        return patient_data
+    return PatientRecord.from_dict(patient_data)
+
+# Risk-summary tables, declared once instead of rebuilt per call:
+# _RISK_CHECKS drives the risk-factor sweep as a single loop over (label,
+# predicate) pairs evaluated on a parsed PatientRecord, and _RECOMMENDATIONS
+# is indexed by the numeric risk code from _RISK_CODES (the old if/elif
+# chains allocated four fresh lists and walked substring compares on every
+# summary)
+_RISK_CHECKS = (
+    ("Advanced age (≥65 years)", lambda r: r.age >= 65),
+    ("Hypertension", lambda r: r.hypertension == 1),
+    ("Heart disease", lambda r: r.heart_disease == 1),
+    ("Diabetes/Pre-diabetes", lambda r: r.avg_glucose_level > 125),
+    ("Obesity", lambda r: r.bmi >= 30),
+    ("Overweight", lambda r: 25 <= r.bmi < 30),
+    ("Current smoking", lambda r: _smoking_code(r) == 2),
+    ("Former smoking", lambda r: _smoking_code(r) == 1),
+)
+
+_RISK_CODES = {LOW_RISK: 0, MODERATE_RISK: 1, HIGH_RISK: 2, VERY_HIGH_RISK: 3}
+_RISK_LABELS = (LOW_RISK, MODERATE_RISK, HIGH_RISK, VERY_HIGH_RISK)
+
+# Classification thresholds/labels as arrays so one searchsorted serves both
+# the scalar path and whole probability vectors in the batch API; object
+# dtype keeps handing out the interned label strings above
+_RISK_THRESH = np.array([0.10, 0.30, 0.60])
+_RISK_LABEL_ARR = np.array(_RISK_LABELS, dtype=object)
+
+_RECOMMENDATIONS = (
+    (   # Low Risk
+        "Continue healthy lifestyle practices",
+        "Regular health check-ups",
+        "Maintain current preventive measures",
+        "Monitor for new risk factors",
+    ),
+    (   # Moderate Risk
+        "Risk factor modification program",
+        "Regular health monitoring",
+        "Lifestyle interventions",
+        "Periodic reassessment",
+    ),
+    (   # High Risk
+        "Comprehensive cardiovascular assessment",
+        "Intensive risk factor management",
+        "Regular monitoring",
+        "Consider specialist consultation",
+    ),
+    (   # Very High Risk
+        "Immediate cardiovascular evaluation recommended",
+        "Consider specialist referral (cardiology/neurology)",
+        "Aggressive risk factor modification",
+        "Close monitoring and follow-up",
+    ),
+)
+
+# Fixed key order for the importance dict; _compute_weights fills a parallel
+# weight list so the per-prediction dict is built in one zip at the boundary
+_IMPORTANCE_KEYS = ('age', 'hypertension', 'heart_disease', 'avg_glucose_level',
+                    'bmi', 'smoking_status', 'gender', 'ever_married')
+
+def _compute_weights(age, hypertension, heart_disease, glucose, bmi,
+                     smoke_code, gender_code, married_code):
+    """Numeric core of the importance heuristic over pre-encoded scalars.
+
+    Pure float arithmetic on positional args — no dict allocation, hashing
+    or string compares — normalized in place before the caller zips the
+    result with _IMPORTANCE_KEYS. This is a simplified heuristic; in
+    production you might use SHAP or similar.
+    """
+    weights = [
+        min(age / 100.0, 0.35),            # Normalize age contribution (max 35%)
+        0.15 if hypertension == 1 else 0.0,
+        0.20 if heart_disease == 1 else 0.0,
+        min(glucose / 200.0, 0.25),        # Normalize glucose (max 25%)
+        0.15 if bmi > 30 else 0.10 if bmi > 25 else 0.05,
+        0.15 if smoke_code == 2 else 0.05 if smoke_code == 1 else 0.0,
+        0.05 if gender_code == 1 else 0.02,
+        0.03 if married_code == 1 else 0.0,
+    ]
+    total = sum(weights)
+    if total > 0:
+        inv = 1.0 / total
+        for i in range(len(weights)):
+            weights[i] *= inv
+    return weights
 
 # Move the cached function outside the class to avoid 'self' hashing issues
 @st.cache_resource
 def load_model(model_path: str):
     """Load calibrated model with caching for performance"""
     try:
-        # Load model using joblib (preferred for scikit-learn models)
-        return joblib.load(model_path)
+        # Load model using joblib (preferred for scikit-learn models),
+        # memory-mapping the large float arrays read-only: buffers are paged
+        # in on demand instead of allocated and copied up front, which cuts
+        # the cold-start cost of the cache_resource warmup. Compressed
+        # pickles ignore mmap_mode and fall back to a regular load.
+        model = joblib.load(model_path, mmap_mode='r')
+        _strip_feature_names(model)
+        return model
     except Exception as e:
         st.error(f"Error loading model: {e}")
         return None
@@ -41,6 +243,20 @@ class ModelHandler:
             print(f"✅ Using FixedFeatureEngineer with {len(self.feature_engineer.feature_names)} features")
         else:
             print(f"❌ Failed to load model from: {model_path}")
+
+        # Warm up the pipeline: the first predict_proba pays lazy sklearn
+        # imports, code paging and BLAS threadpool spin-up, so spend that on
+        # a dummy vector here rather than on the user's first click
+        if self.model is not None:
+            try:
+                self.model.predict_proba(
+                    np.zeros((1, len(FEATURE_ORDER)), dtype=np.float32))
+            except Exception:
+                pass
+
+        # Nothing in the model info changes after construction, so build the
+        # dict once instead of re-walking the pipeline per UI refresh
+        self._model_info = self._build_model_info()
     
     def predict_stroke_risk(self, patient_data: Dict) -> Tuple[float, str, Dict]:
         """Generate stroke risk prediction with clinical interpretation"""
@@ -49,84 +265,110 @@ class ModelHandler:
             raise Exception("Model not loaded properly")
         
         try:
-            # Engineer features as DataFrame with proper column names (fixes StandardScaler warnings)
-            features_df = self.feature_engineer.create_feature_dataframe(patient_data)
-            
-            # Debug information (can be removed in production)
-            print(f"🎯 Model input shape: {features_df.shape}")
-            print(f"🎯 Model input columns: {len(features_df.columns)} features")
-            print(f"🎯 Model input range: {features_df.values.min():.3f} to {features_df.values.max():.3f}")
-            
-            # Get calibrated probability (DataFrame maintains feature names for StandardScaler)
-            probabilities = self.model.predict_proba(features_df)
+            # Engineer features as a (1, N) ndarray in FEATURE_ORDER; the
+            # module-level warning filters already silence the StandardScaler
+            # feature-name warning, so the DataFrame wrapper (and the Index
+            # construction + dtype coercion sklearn pays to unwrap it) is
+            # gone from the per-predict path
+            features = self.feature_engineer.create_feature_array(patient_data)
+
+            # Debug diagnostics: the min()/max() reductions are full array
+            # scans, so only compute them when debug logging is actually on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🎯 Model input shape: %s (%d features), range %.3f to %.3f",
+                             features.shape, features.shape[1],
+                             features.min(), features.max())
+
+            # Get calibrated probability
+            probabilities = self.model.predict_proba(features)
             probability = probabilities[0, 1]  # Stroke probability (class 1)
-            
-            print(f"🎯 Raw probabilities: {probabilities[0]}")
-            print(f"🎯 Stroke probability: {probability:.6f} ({probability*100:.1f}%)")
-            
+
+            logger.debug("🎯 Raw probabilities: %s -> stroke probability %.6f",
+                         probabilities[0], probability)
+
+
             # Risk classification
             risk_level = self._classify_risk(probability)
             
             # Feature importance (simplified version)
-            feature_importance = self._get_feature_importance(features_df.iloc[0].to_dict(), patient_data)
+            feature_importance = self._get_feature_importance(patient_data)
             
             return probability, risk_level, feature_importance
             
-        except Exception as e:
-            print(f"❌ Prediction failed in ModelHandler: {e}")
-            import traceback
-            traceback.print_exc()
-            raise e
+        except Exception:
+            logger.exception("❌ Prediction failed in ModelHandler")
+            raise
     
-    def _classify_risk(self, probability: float) -> str:
-        """Classify risk level based on calibrated probability"""
-        if probability < 0.10:
-            return "Low Risk"
-        elif probability < 0.30:
-            return "Moderate Risk"
-        elif probability < 0.60:
-            return "High Risk"
-        else:
-            return "Very High Risk"
+    def predict_from_array(self, x: np.ndarray) -> Tuple[float, str]:
+        """Predict directly from a prebuilt feature vector in FEATURE_ORDER.
+
+        Skips the per-call dict → feature-mapping → list construction in the
+        feature engineer, which dominates Naive Bayes inference latency.
+        Feature-name metadata is stripped from the pipeline at load, so the
+        raw ndarray goes straight in without a DataFrame wrapper.
+        """
+        if self.model is None:
+            raise Exception("Model not loaded properly")
+
+        probability = self.model.predict_proba(
+            np.asarray(x, dtype=np.float64).reshape(1, -1))[0, 1]
+        return probability, self._classify_risk(probability)
+
+    def predict_stroke_risk_batch(self, patients: List[Dict]) -> List[Tuple[float, str]]:
+        """Predict stroke risk for many patients with one model call.
+
+        Stacks the engineered features into an (N, F) float32 matrix and
+        runs a single predict_proba, amortizing sklearn's input validation
+        and the BLAS dispatch across the batch instead of paying them per
+        patient; risk classification is vectorized through _classify_risk.
+        """
+        if self.model is None:
+            raise Exception("Model not loaded properly")
+
+        features = self.feature_engineer.engineer_features_batch(patients)
+        probabilities = self.model.predict_proba(features)[:, 1]
+        risk_levels = self._classify_risk(probabilities)
+        return [(float(p), level) for p, level in zip(probabilities, risk_levels)]
+
+    def _classify_risk(self, probability):
+        """Classify risk level for a calibrated probability.
+
+        Works on scalars and on probability arrays (returning a label
+        array), so the batch path classifies without a Python loop.
+        side='right' keeps the original boundary semantics: a probability
+        exactly on a threshold lands in the higher band.
+        """
+        return _RISK_LABEL_ARR[
+            np.searchsorted(_RISK_THRESH, probability, side='right')]
     
-    def _get_feature_importance(self, features_dict: Dict, patient_data: Dict) -> Dict[str, float]:
+    def _get_feature_importance(self, patient_data: Dict) -> Dict[str, float]:
         """Get simplified feature importance for interpretation"""
-        
-        # Define key features and their relative importance weights
-        # This is a simplified version - in production you might use SHAP or similar
-        age = patient_data.get('age', 50)
-        hypertension = patient_data.get('hypertension', 0)
-        heart_disease = patient_data.get('heart_disease', 0)
-        avg_glucose_level = patient_data.get('avg_glucose_level', 100)
-        bmi = patient_data.get('bmi', 25)
-        smoking_status = patient_data.get('smoking_status', 'never_smoked')
-        gender = patient_data.get('gender', 'Male')
-        ever_married = patient_data.get('ever_married', 'Yes')
-        
-        feature_weights = {
-            'age': min(age / 100.0, 0.35),  # Normalize age contribution (max 35%)
-            'hypertension': 0.15 if hypertension == 1 else 0.0,
-            'heart_disease': 0.20 if heart_disease == 1 else 0.0,
-            'avg_glucose_level': min(avg_glucose_level / 200.0, 0.25),  # Normalize glucose (max 25%)
-            'bmi': 0.15 if bmi > 30 else 0.10 if bmi > 25 else 0.05,
-            'smoking_status': 0.15 if 'smokes' in smoking_status else 
-                            0.05 if 'formerly' in smoking_status else 0.0,
-            'gender': 0.05 if gender == 'Male' else 0.02,
-            'ever_married': 0.03 if ever_married == 'Yes' else 0.0
-        }
-        
-        # Normalize to sum to 1.0
-        total_weight = sum(feature_weights.values())
-        if total_weight > 0:
-            feature_weights = {k: v/total_weight for k, v in feature_weights.items()}
-        
-        return feature_weights
+
+        # Parse to a typed record once, run the numeric core over slot
+        # loads, and only build a dict at this boundary
+        smoke_code = _smoking_code(patient_data)
+        record = _as_record(patient_data)
+        weights = _compute_weights(
+            record.age,
+            record.hypertension,
+            record.heart_disease,
+            record.avg_glucose_level,
+            record.bmi,
+            smoke_code,
+            int(record.gender == Gender.MALE),
+            int(record.ever_married == 'Yes'),
+        )
+        return dict(zip(_IMPORTANCE_KEYS, weights))
     
     def get_model_info(self) -> Dict:
-        """Get model information for display"""
+        """Get model information for display (precomputed at construction)"""
+        return self._model_info
+
+    def _build_model_info(self) -> Dict:
+        """Walk the pipeline once and assemble the model-info dict"""
         if self.model is None:
             return {"status": "Model not loaded"}
-        
+
         try:
             # Try to get model information
             model_type = type(self.model).__name__
@@ -153,111 +395,32 @@ class ModelHandler:
             return {"status": f"Error getting model info: {e}"}
     
     def validate_prediction_inputs(self, patient_data: Dict) -> Tuple[bool, List[str]]:
-        """Validate inputs before prediction"""
-        errors = []
-        
-        required_fields = [
-            'age', 'gender', 'hypertension', 'heart_disease', 
-            'ever_married', 'work_type', 'Residence_type', 
-            'avg_glucose_level', 'bmi', 'smoking_status'
-        ]
-        
-        # Check for missing fields
-        for field in required_fields:
-            if field not in patient_data:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate ranges
-        if 'age' in patient_data:
-            if not (18 <= patient_data['age'] <= 120):
-                errors.append("Age must be between 18 and 120 years")
-        
-        if 'bmi' in patient_data:
-            if not (10.0 <= patient_data['bmi'] <= 70.0):
-                errors.append("BMI must be between 10.0 and 70.0")
-        
-        if 'avg_glucose_level' in patient_data:
-            if not (50.0 <= patient_data['avg_glucose_level'] <= 400.0):
-                errors.append("Glucose level must be between 50.0 and 400.0 mg/dL")
-        
-        # Validate categorical fields
-        if 'gender' in patient_data:
-            if patient_data['gender'] not in ['Male', 'Female']:
-                errors.append("Gender must be 'Male' or 'Female'")
-        
-        if 'ever_married' in patient_data:
-            if patient_data['ever_married'] not in ['Yes', 'No']:
-                errors.append("Ever married must be 'Yes' or 'No'")
-        
-        if 'hypertension' in patient_data:
-            if patient_data['hypertension'] not in [0, 1]:
-                errors.append("Hypertension must be 0 or 1")
-        
-        if 'heart_disease' in patient_data:
-            if patient_data['heart_disease'] not in [0, 1]:
-                errors.append("Heart disease must be 0 or 1")
-        
-        return len(errors) == 0, errors
+        """Validate inputs before prediction.
+
+        The range and categorical rules live in the shared InputValidator
+        now (they used to be duplicated here, so every submit ran both
+        copies); only the required-field presence check stays, done as one
+        set difference.
+        """
+        missing = _REQUIRED_FIELDS - patient_data.keys()
+        if missing:
+            return False, [f"Missing required field: {field}"
+                           for field in sorted(missing)]
+        return get_validator().validate_patient_data(patient_data)
     
     def create_risk_summary(self, patient_data: Dict, probability: float, risk_level: str) -> Dict:
         """Create a comprehensive risk summary for clinical use"""
         
-        # Calculate risk factors present
-        risk_factors = []
-        
-        if patient_data.get('age', 0) >= 65:
-            risk_factors.append("Advanced age (≥65 years)")
-        
-        if patient_data.get('hypertension', 0) == 1:
-            risk_factors.append("Hypertension")
-        
-        if patient_data.get('heart_disease', 0) == 1:
-            risk_factors.append("Heart disease")
-        
-        if patient_data.get('avg_glucose_level', 0) > 125:
-            risk_factors.append("Diabetes/Pre-diabetes")
-        
-        if patient_data.get('bmi', 0) >= 30:
-            risk_factors.append("Obesity")
-        elif patient_data.get('bmi', 0) >= 25:
-            risk_factors.append("Overweight")
-        
-        smoking = patient_data.get('smoking_status', 'never_smoked')
-        if 'smokes' in smoking:
-            risk_factors.append("Current smoking")
-        elif 'formerly' in smoking:
-            risk_factors.append("Former smoking")
-        
-        # Clinical recommendations based on risk level
-        if 'Very High' in risk_level:
-            recommendations = [
-                "Immediate cardiovascular evaluation recommended",
-                "Consider specialist referral (cardiology/neurology)",
-                "Aggressive risk factor modification",
-                "Close monitoring and follow-up"
-            ]
-        elif 'High' in risk_level:
-            recommendations = [
-                "Comprehensive cardiovascular assessment",
-                "Intensive risk factor management",
-                "Regular monitoring",
-                "Consider specialist consultation"
-            ]
-        elif 'Moderate' in risk_level:
-            recommendations = [
-                "Risk factor modification program",
-                "Regular health monitoring",
-                "Lifestyle interventions",
-                "Periodic reassessment"
-            ]
-        else:  # Low Risk
-            recommendations = [
-                "Continue healthy lifestyle practices",
-                "Regular health check-ups",
-                "Maintain current preventive measures",
-                "Monitor for new risk factors"
-            ]
-        
+        # Risk factors present: parse once, then one pass over the
+        # precompiled check table with slot attribute loads
+        record = _as_record(patient_data)
+        risk_factors = [label for label, check in _RISK_CHECKS if check(record)]
+
+        # Clinical recommendations: table lookup on the numeric risk code
+        recommendations = list(
+            _RECOMMENDATIONS[_RISK_CODES.get(risk_level, 0)])
+
+
         return {
             'probability': probability,
             'probability_percent': probability * 100,
@@ -265,9 +428,22 @@ class ModelHandler:
             'risk_factors_present': risk_factors,
             'risk_factor_count': len(risk_factors),
             'recommendations': recommendations,
-            'assessment_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            # stdlib datetime: pd.Timestamp.now() drags in tz/nanosecond
+            # machinery just to format a wall-clock string
+            'assessment_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
+@st.cache_resource
+def get_model_handler(model_path: str = "models/stroke_prediction_calibrated.pkl") -> ModelHandler:
+    """One ModelHandler per server process.
+
+    load_model already caches the estimator, but each Streamlit rerun still
+    paid FixedFeatureEngineer construction and the startup logging; caching
+    the whole handler removes that from the rerun path and lets every page
+    share one instance.
+    """
+    return ModelHandler(model_path)
+
 # Quick test function for development
 def test_model_handler():
     """Test function to verify ModelHandler is working correctly"""
@@ -0,0 +1,92 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict
+
+import streamlit as st
+
+# Batch window: collect up to BATCH_SIZE requests or wait BATCH_TIMEOUT_MS,
+# whichever comes first. 20ms is invisible next to network latency but wide
+# enough to catch near-simultaneous submissions from concurrent sessions.
+BATCH_SIZE = 16
+BATCH_TIMEOUT_MS = 20
+
+class PredictionBatcher:
+    """Micro-batches predict_stroke_risk calls from concurrent sessions.
+
+    Streamlit serves every session from one process, so N users submitting
+    at roughly the same time normally trigger N separate predict_proba
+    calls. A single daemon worker drains the queue, concatenates the
+    engineered feature frames and makes one model call per batch, then
+    fulfills each caller's Future with the usual (probability, risk_level,
+    feature_importance) tuple.
+    """
+
+    def __init__(self, model_handler):
+        self.model_handler = model_handler
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, patient_data: Dict) -> Future:
+        """Enqueue one patient for prediction; returns a Future."""
+        future = Future()
+        self._queue.put((patient_data, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+
+            # Hold the window open briefly to absorb concurrent submissions
+            deadline = time.monotonic() + BATCH_TIMEOUT_MS / 1000.0
+            while len(batch) < BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._process(batch)
+
+    def _process(self, batch):
+        handler = self.model_handler
+
+        # Single-request batches take the existing scalar path unchanged
+        if len(batch) == 1:
+            patient_data, future = batch[0]
+            try:
+                future.set_result(handler.predict_stroke_risk(patient_data))
+            except Exception as e:
+                future.set_exception(e)
+            return
+
+        try:
+            engineer = handler.feature_engineer
+
+            # One vectorized engineering pass and one predict_proba for the
+            # whole batch amortize the sklearn dispatch and BLAS overhead
+            # across every queued session
+            # Feature-name metadata is stripped from the pipeline at load,
+            # so the float32 matrix goes straight in — no DataFrame wrapper
+            features = engineer.engineer_features_batch(
+                [patient_data for patient_data, _ in batch])
+            probabilities = handler.model.predict_proba(features)
+
+            for i, (patient_data, future) in enumerate(batch):
+                probability = probabilities[i, 1]
+                risk_level = handler._classify_risk(probability)
+                feature_importance = handler._get_feature_importance(patient_data)
+                future.set_result((probability, risk_level, feature_importance))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+@st.cache_resource
+def get_prediction_batcher(_model_handler) -> PredictionBatcher:
+    """One batcher (and worker thread) per server process."""
+    return PredictionBatcher(_model_handler)
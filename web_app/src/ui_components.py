@@ -1,6 +1,35 @@
+import plotly.graph_objects as go
 import streamlit as st
 from typing import Dict, Any
 
+# Static gauge band definition, built once at import instead of per figure
+_GAUGE_STEPS = [
+    {'range': [0, 10], 'color': "lightgreen"},
+    {'range': [10, 30], 'color': "yellow"},
+    {'range': [30, 60], 'color': "orange"},
+    {'range': [60, 100], 'color': "red"}
+]
+
+# Risk-level lookup tables shared by the render helpers, hoisted so the hot
+# UI path stops re-allocating a four-entry dict per call
+_GAUGE_COLOR = {
+    "Low Risk": "green",
+    "Moderate Risk": "yellow",
+    "High Risk": "orange",
+    "Very High Risk": "red"
+}
+_RISK_EMOJI = {
+    "Low Risk": "🟢",
+    "Moderate Risk": "🟡",
+    "High Risk": "🟠",
+    "Very High Risk": "🔴"
+}
+
+# Smoking selectbox label → small int code (0 never/unknown, 1 former,
+# 2 current), encoded once at the form boundary so the model handler's
+# importance and risk-summary checks are integer compares
+_SMOKE_CODES = {'never smoked': 0, 'formerly smoked': 1, 'smokes': 2, 'Unknown': 0}
+
 def setup_page_config():
     """Configure Streamlit page settings"""
     st.set_page_config(
@@ -15,9 +44,11 @@ def setup_page_config():
         }
     )
 
-def display_header():
-    """Display the main application header"""
-    st.markdown("""
+@st.cache_data
+def _header_html() -> str:
+    """CSS + header markup assembled once per process; reruns just replay
+    the cached string instead of re-parsing two markdown blocks."""
+    return """
     <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -38,14 +69,15 @@ def display_header():
         opacity: 0.9;
     }
     </style>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("""
     <div class="main-header">
         <h1>🏥 Stroke Risk Prediction Tool</h1>
         <p>AI-Powered Clinical Decision Support System</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def display_header():
+    """Display the main application header"""
+    st.markdown(_header_html(), unsafe_allow_html=True)
 
 def create_patient_form() -> Dict[str, Any]:
     """Create and return patient data input form"""
@@ -123,6 +155,7 @@ def create_patient_form() -> Dict[str, Any]:
                 options=["never smoked", "formerly smoked", "smokes", "Unknown"],
                 help="Patient's smoking history"
             )
+            patient_data['_smoke_code'] = _SMOKE_CODES[patient_data['smoking_status']]
     
     # Clinical Measurements Section
     with st.expander("📊 Clinical Measurements", expanded=True):
@@ -172,32 +205,22 @@ def create_patient_form() -> Dict[str, Any]:
     
     return patient_data
 
-def display_risk_gauge(probability: float, risk_level: str):
-    """Display risk gauge using Plotly"""
-    import plotly.graph_objects as go
-    
-    # Determine gauge color based on risk level
-    color_map = {
-        "Low Risk": "green",
-        "Moderate Risk": "yellow", 
-        "High Risk": "orange",
-        "Very High Risk": "red"
-    }
-    
+def _build_gauge_skeleton(risk_level: str):
+    """Full Indicator figure for one risk level.
+
+    Built at most once per level and reused from session state; everything
+    except the gauge value is a function of the risk level, so reruns only
+    have to poke the value instead of reconstructing the whole figure.
+    """
     fig = go.Figure(go.Indicator(
         mode = "gauge+number+delta",
-        value = probability * 100,
+        value = 0.0,
         domain = {'x': [0, 1], 'y': [0, 1]},
         title = {'text': f"Stroke Risk: {risk_level}"},
         gauge = {
             'axis': {'range': [None, 100]},
-            'bar': {'color': color_map.get(risk_level, "blue")},
-            'steps': [
-                {'range': [0, 10], 'color': "lightgreen"},
-                {'range': [10, 30], 'color': "yellow"},
-                {'range': [30, 60], 'color': "orange"},
-                {'range': [60, 100], 'color': "red"}
-            ],
+            'bar': {'color': _GAUGE_COLOR.get(risk_level, "blue")},
+            'steps': _GAUGE_STEPS,
             'threshold': {
                 'line': {'color': "red", 'width': 4},
                 'thickness': 0.75,
@@ -205,21 +228,22 @@ def display_risk_gauge(probability: float, risk_level: str):
             }
         }
     ))
-    
+
     fig.update_layout(height=400)
+    return fig
+
+def display_risk_gauge(probability: float, risk_level: str):
+    """Display risk gauge using Plotly"""
+    gauges = st.session_state.setdefault('_gauges', {})
+    fig = gauges.get(risk_level)
+    if fig is None:
+        fig = gauges[risk_level] = _build_gauge_skeleton(risk_level)
+    fig.data[0].value = probability * 100
     st.plotly_chart(fig, use_container_width=True)
 
 def display_risk_summary(probability: float, risk_level: str, patient_data: Dict):
     """Display risk summary with key information"""
-    
-    # Risk level color mapping
-    color_map = {
-        "Low Risk": "🟢",
-        "Moderate Risk": "🟡", 
-        "High Risk": "🟠",
-        "Very High Risk": "🔴"
-    }
-    
+
     st.markdown("### 📊 Risk Assessment Summary")
     
     col1, col2, col3 = st.columns(3)
@@ -234,19 +258,20 @@ def display_risk_summary(probability: float, risk_level: str, patient_data: Dict
     with col2:
         st.metric(
             label="Risk Classification",
-            value=f"{color_map.get(risk_level, '⚪')} {risk_level}",
+            value=f"{_RISK_EMOJI.get(risk_level, '⚪')} {risk_level}",
             delta=None
         )
     
     with col3:
-        # Calculate risk factors count
-        risk_factors = sum([
-            patient_data.get('hypertension', 0),
-            patient_data.get('heart_disease', 0),
-            1 if patient_data.get('bmi', 0) > 30 else 0,
-            1 if patient_data.get('avg_glucose_level', 0) > 140 else 0,
-            1 if patient_data.get('smoking_status') == 'smokes' else 0
-        ])
+        # Calculate risk factors count: straight int arithmetic (bools count
+        # as 1) instead of building a throwaway list for sum()
+        risk_factors = (
+            patient_data.get('hypertension', 0)
+            + patient_data.get('heart_disease', 0)
+            + (patient_data.get('bmi', 0) > 30)
+            + (patient_data.get('avg_glucose_level', 0) > 140)
+            + (patient_data.get('smoking_status') == 'smokes')
+        )
         
         st.metric(
             label="Risk Factors Present",
@@ -287,7 +312,9 @@ def create_sidebar_navigation():
         st.info("Version 1.0\nFor educational use only")
 
 def show_loading_spinner(text="Processing..."):
-    """Show loading spinner with custom text"""
-    with st.spinner(text):
-        import time
-        time.sleep(1)  # Simulate processing time
\ No newline at end of file
+    """Spinner context manager with custom text.
+
+    Use as `with show_loading_spinner("..."):` around the real work; the
+    old simulated time.sleep(1) added a flat second to every call site.
+    """
+    return st.spinner(text)
\ No newline at end of file
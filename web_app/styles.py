@@ -0,0 +1,20 @@
+# Shared CSS loader for the Streamlit pages
+# The stylesheet lives in assets/styles.css (one merged bundle for the whole
+# app); get_css() is cached so the same payload is reused on every rerun
+# instead of re-reading the file and re-serializing it to the frontend.
+
+from pathlib import Path
+
+import streamlit as st
+
+_CSS_PATH = Path(__file__).parent / "assets" / "styles.css"
+
+
+@st.cache_data(persist="disk")
+def get_css() -> str:
+    """Return the app-wide stylesheet wrapped in a <style> tag.
+
+    persist="disk" keeps the entry across server restarts, so dev reloads
+    and cold starts skip rebuilding the bundle.
+    """
+    return f"<style>\n{_CSS_PATH.read_text()}\n</style>"